@@ -32,6 +32,7 @@ from src.yt_study_buddy.study_notes_generator import StudyNotesGenerator
 from src.yt_study_buddy.assessment_generator import AssessmentGenerator
 from src.yt_study_buddy.obsidian_linker import ObsidianLinker
 from src.yt_study_buddy.job_logger import JobLogger
+from src.yt_study_buddy.llm_cache import LLMCache
 
 
 class RetryScheduler:
@@ -309,12 +310,13 @@ class RetryScheduler:
     def _setup_components(self) -> Dict:
         """Setup processing components."""
         video_processor = VideoProcessor("tor")
-        notes_generator = StudyNotesGenerator()
+        llm_cache = LLMCache()
+        notes_generator = StudyNotesGenerator(llm_cache=llm_cache)
 
         # Setup assessment generator with Claude client
         assessment_generator = None
         if notes_generator.client:  # Reuse Claude client from notes generator
-            assessment_generator = AssessmentGenerator(notes_generator.client)
+            assessment_generator = AssessmentGenerator(notes_generator.client, llm_cache=llm_cache)
 
         obsidian_linker = ObsidianLinker()
         job_logger = JobLogger(log_file=str(self.log_path))
@@ -13,7 +13,7 @@ from .video_job import create_job_from_url
 from .processing_pipeline import process_video_job
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     """Result of processing a single video."""
     success: bool
@@ -0,0 +1,58 @@
+"""
+Atomic file writes for pipeline outputs, job logs and tracker files.
+"""
+import os
+from pathlib import Path
+from typing import Iterable, Union
+
+
+# os.fdatasync is not available on macOS/Windows
+_datasync = getattr(os, 'fdatasync', os.fsync)
+
+
+def write_atomic(
+    path: Path,
+    content: Union[str, bytes, Iterable[str]],
+    durable: bool = True
+):
+    """
+    Write a file so readers only ever see the old or the complete new version.
+
+    Content goes to a hidden temp file next to the target (.<name>.tmp),
+    is synced, and is then renamed over the target. A crash mid-write
+    leaves only the temp file behind, never a truncated output.
+
+    Args:
+        path: Destination file path
+        content: Text (UTF-8), bytes, or an iterable of text/bytes chunks
+        durable: Sync the temp file before the rename. Pass False for
+            frequently rewritten files that can be rebuilt; the rename
+            still keeps readers from seeing a partial file.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_BINARY', 0)
+
+    try:
+        fd = os.open(tmp_path, flags, 0o644)
+    except FileExistsError:
+        # Leftover from a crashed write
+        tmp_path.unlink()
+        fd = os.open(tmp_path, flags, 0o644)
+
+    try:
+        with os.fdopen(fd, 'wb', buffering=1 << 20) as f:
+            if isinstance(content, bytes):
+                f.write(content)
+            elif isinstance(content, str):
+                f.write(content.encode('utf-8'))
+            else:
+                for chunk in content:
+                    f.write(chunk if isinstance(chunk, bytes) else chunk.encode('utf-8'))
+            if durable:
+                f.flush()
+                _datasync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -8,18 +8,24 @@ import re
 from datetime import datetime
 from typing import Dict, Optional
 
+from .llm_cache import batched_completion, cached_completion
+
+ASSESSMENT_MODEL = "claude-sonnet-4-5-20250929"  # Claude Sonnet 4.5 (latest)
+
 
 class AssessmentGenerator:
     """Generates learning assessments and questions from video content."""
 
-    def __init__(self, claude_client):
+    def __init__(self, claude_client, llm_cache=None):
         """
         Initialize the assessment generator.
 
         Args:
             claude_client: Anthropic Claude client for generating questions
+            llm_cache: Optional LLMCache for reusing responses across runs
         """
         self.claude_client = claude_client
+        self.llm_cache = llm_cache
 
     def generate_assessment(self, transcript: str, notes_content: str,
                           video_title: str, video_url: str) -> str:
@@ -50,11 +56,81 @@ class AssessmentGenerator:
             logging.error(f"Error generating assessment: {e}")
             return self._create_fallback_assessment(video_title, video_url)
 
+    def generate_assessment_batch(self, requests: Dict[str, Dict]) -> Dict[str, str]:
+        """
+        Generate assessments for many videos in one Message Batches submission.
+
+        Args:
+            requests: Dict of request ID (e.g., video ID) -> dict with
+                      'transcript', 'notes_content', 'video_title', 'video_url'
+
+        Returns:
+            Dict of request ID -> formatted assessment markdown. Requests that
+            failed in the batch are omitted so callers can fall back to
+            generate_assessment().
+        """
+        prompts = {
+            request_id: self._build_questions_prompt(
+                item['transcript'], item['notes_content'], item['video_title']
+            )
+            for request_id, item in requests.items()
+        }
+
+        try:
+            responses = batched_completion(
+                self.claude_client,
+                ASSESSMENT_MODEL,
+                prompts,
+                max_tokens=2000,
+                cache=self.llm_cache
+            )
+        except Exception as e:
+            logging.error(f"Error submitting assessment batch to Claude API: {e}")
+            return {}
+
+        assessments = {}
+        for request_id, response_text in responses.items():
+            item = requests[request_id]
+            questions_data = self._parse_questions(response_text, item['video_title'])
+            assessments[request_id] = self._format_assessment_file(
+                questions_data, item['video_title'], item['video_url']
+            )
+        return assessments
+
     def _generate_questions(self, transcript: str, notes_content: str,
                           video_title: str) -> Dict:
         """Generate different types of questions using Claude."""
+        prompt = self._build_questions_prompt(transcript, notes_content, video_title)
+
+        try:
+            response_text = cached_completion(
+                self.claude_client,
+                ASSESSMENT_MODEL,
+                prompt,
+                max_tokens=2000,
+                cache=self.llm_cache
+            )
+            return self._parse_questions(response_text, video_title)
+
+        except Exception as e:
+            logging.error(f"Error calling Claude API for questions: {e}")
+            return self._create_fallback_questions(video_title)
 
-        prompt = f"""Based on this YouTube video, create a learning assessment with 5-7 questions that test deep understanding.
+    def _parse_questions(self, response_text: str, video_title: str) -> Dict:
+        """Parse Claude's JSON questions, falling back to generic questions."""
+        questions_data = self._extract_json_from_response(response_text)
+
+        if questions_data:
+            return questions_data
+
+        logging.warning("Could not parse JSON from Claude response, using fallback questions")
+        return self._create_fallback_questions(video_title)
+
+    def _build_questions_prompt(self, transcript: str, notes_content: str,
+                                video_title: str) -> str:
+        """Build the question-generation prompt."""
+
+        return f"""Based on this YouTube video, create a learning assessment with 5-7 questions that test deep understanding.
 
 VIDEO TITLE: {video_title}
 
@@ -95,27 +171,6 @@ Return this exact JSON structure:
     ]
 }}"""
 
-        try:
-            response = self.claude_client.messages.create(
-                model="claude-sonnet-4-5-20250929",  # Claude Sonnet 4.5 (latest)
-                max_tokens=2000,
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            # Extract and parse JSON from response
-            response_text = response.content[0].text
-            questions_data = self._extract_json_from_response(response_text)
-
-            if questions_data:
-                return questions_data
-            else:
-                logging.warning("Could not parse JSON from Claude response, using fallback questions")
-                return self._create_fallback_questions(video_title)
-
-        except Exception as e:
-            logging.error(f"Error calling Claude API for questions: {e}")
-            return self._create_fallback_questions(video_title)
-
     def _extract_json_from_response(self, response_text: str) -> Optional[Dict]:
         """
         Extract and parse JSON from Claude's response, handling various formats.
@@ -218,7 +273,8 @@ Return this exact JSON structure:
                               video_url: str) -> str:
         """Format questions into a markdown assessment file."""
 
-        assessment_content = f"""# {video_title} - Learning Assessment
+        # Collect parts and join once instead of rebuilding the string per line
+        parts = [f"""# {video_title} - Learning Assessment
 
 [Original Video]({video_url})
 
@@ -232,7 +288,7 @@ Answer each question in the space provided. Focus on demonstrating understanding
 
 ---
 
-"""
+"""]
 
         question_num = 1
 
@@ -242,19 +298,21 @@ Answer each question in the space provided. Focus on demonstrating understanding
                 continue
 
             category_title = self._get_category_title(category)
-            assessment_content += f"## {category_title}\n\n"
+            parts.append(f"## {category_title}\n\n")
 
             for q in questions:
-                assessment_content += f"### Question {question_num}\n"
-                assessment_content += f"{q['question']}\n\n"
-                assessment_content += f"**Your Answer:**\n"
-                assessment_content += f"[Write your response here]\n\n"
-                assessment_content += f"---\n\n"
+                parts.append(
+                    f"### Question {question_num}\n"
+                    f"{q['question']}\n\n"
+                    "**Your Answer:**\n"
+                    "[Write your response here]\n\n"
+                    "---\n\n"
+                )
                 question_num += 1
 
         # Add model answers section (hidden)
-        assessment_content += "## Model Answers\n\n"
-        assessment_content += "<!-- SPOILER ALERT: Model answers below. Complete your answers first! -->\n\n"
+        parts.append("## Model Answers\n\n")
+        parts.append("<!-- SPOILER ALERT: Model answers below. Complete your answers first! -->\n\n")
 
         question_num = 1
         for category, questions in questions_data.items():
@@ -262,16 +320,18 @@ Answer each question in the space provided. Focus on demonstrating understanding
                 continue
 
             category_title = self._get_category_title(category)
-            assessment_content += f"### {category_title} - Model Answers\n\n"
+            parts.append(f"### {category_title} - Model Answers\n\n")
 
             for q in questions:
-                assessment_content += f"**Question {question_num}:** {q['question']}\n\n"
-                assessment_content += f"**Model Answer:** {q['model_answer']}\n\n"
-                assessment_content += f"**Key Concepts:** {', '.join(q['concepts'])}\n\n"
-                assessment_content += f"---\n\n"
+                parts.append(
+                    f"**Question {question_num}:** {q['question']}\n\n"
+                    f"**Model Answer:** {q['model_answer']}\n\n"
+                    f"**Key Concepts:** {', '.join(q['concepts'])}\n\n"
+                    "---\n\n"
+                )
                 question_num += 1
 
-        return assessment_content
+        return ''.join(parts)
 
     def _get_category_title(self, category: str) -> str:
         """Convert category key to display title."""
@@ -6,17 +6,20 @@ Automatically categorizes videos into subjects when no subject is provided.
 import logging
 import os
 import re
+import threading
 from typing import List, Optional
 
 from dotenv import load_dotenv
 
+from .embedding_cache import EmbeddingCache
+
 # Load environment variables
 load_dotenv()
 
 try:
     from sentence_transformers import SentenceTransformer
-    from sklearn.metrics.pairwise import cosine_similarity
     import numpy as np
+    import torch
     SEMANTIC_AVAILABLE = True
 except ImportError:
     SEMANTIC_AVAILABLE = False
@@ -26,32 +29,92 @@ except ImportError:
 class AutoCategorizer:
     """Automatically categorizes video content into appropriate subjects."""
 
-    def __init__(self, model_name: Optional[str] = None):
+    def __init__(self, model_name: Optional[str] = None, use_embedding_cache: bool = True,
+                 precision: Optional[str] = None, backend: Optional[str] = None):
         """
         Initialize the auto-categorizer.
 
         Args:
             model_name: Name of the sentence transformer model to use (defaults to env var or 'all-MiniLM-L6-v2')
+            use_embedding_cache: Reuse embeddings from the on-disk cache (default: True)
+            precision: 'fp32', 'fp16' or 'bf16' (defaults to env var or 'fp32').
+                Half precision is only applied when the model runs on CUDA.
+            backend: 'torch', 'onnx' or 'openvino' (defaults to env var or 'torch').
+                ONNX/OpenVINO need sentence-transformers>=3.2 with the optimum extras.
         """
         # Get model name from environment or use default
         self.model_name = model_name or os.getenv('SENTENCE_TRANSFORMER_MODEL', 'all-MiniLM-L6-v2')
+        self.precision = (precision or os.getenv('SENTENCE_TRANSFORMER_PRECISION', 'fp32')).lower()
+        self.backend = (backend or os.getenv('SENTENCE_TRANSFORMER_BACKEND', 'torch')).lower()
         self.model = None
+        self.use_embedding_cache = use_embedding_cache
+        self.embedding_cache = None
         self._similarity_threshold = 0.6
+        self._load_lock = threading.Lock()
 
     def _load_model(self):
         """Lazy load the sentence transformer model."""
         if not SEMANTIC_AVAILABLE:
             return False
 
-        if self.model is None:
+        if self.model is not None:
+            return True
+
+        # Parallel workers categorize concurrently; load the model only once
+        with self._load_lock:
+            if self.model is None:
+                try:
+                    logging.info(f"Loading sentence transformer model: {self.model_name}")
+                    model = self._create_model()
+                    self._apply_precision(model)
+                    if self.use_embedding_cache:
+                        self.embedding_cache = EmbeddingCache()
+                    self.model = model
+                except Exception as e:
+                    logging.error(f"Failed to load model {self.model_name}: {e}")
+                    return False
+        return True
+
+    def warmup(self):
+        """
+        Load the model and run one tiny encode.
+
+        Moves model load and first-kernel setup out of the first
+        categorize_video() call, e.g. by running this in a background
+        thread while the first transcript is being fetched.
+        """
+        if self._load_model():
             try:
-                logging.info(f"Loading sentence transformer model: {self.model_name}")
-                self.model = SentenceTransformer(self.model_name)
-                return True
+                self._model_encode(["warmup", "warmup"])
             except Exception as e:
-                logging.error(f"Failed to load model {self.model_name}: {e}")
-                return False
-        return True
+                logging.warning(f"Model warmup failed: {e}")
+
+    def _create_model(self):
+        """Build the model on the configured backend, falling back to PyTorch."""
+        if self.backend == 'torch':
+            return SentenceTransformer(self.model_name)
+
+        try:
+            return SentenceTransformer(self.model_name, backend=self.backend)
+        except Exception as e:
+            logging.warning(f"Could not load {self.model_name} with {self.backend} backend, using torch: {e}")
+            self.backend = 'torch'
+            return SentenceTransformer(self.model_name)
+
+    def _apply_precision(self, model):
+        """Cast model weights to half precision when running on a GPU."""
+        if self.precision == 'fp32' or self.backend != 'torch' or model.device.type != 'cuda':
+            return
+
+        if self.precision == 'fp16':
+            model.half()
+        elif self.precision == 'bf16':
+            model.to(dtype=torch.bfloat16)
+        else:
+            logging.warning(f"Unknown precision '{self.precision}', using fp32")
+            return
+
+        logging.info(f"Running {self.model_name} in {self.precision} on {model.device}")
 
     def categorize_video(self, transcript: str, video_title: str, output_dir: str,
                         subject: Optional[str] = None) -> str:
@@ -99,10 +162,11 @@ class AutoCategorizer:
 
         subjects = []
         try:
-            for item in os.listdir(output_dir):
-                item_path = os.path.join(output_dir, item)
-                if os.path.isdir(item_path) and not item.startswith('.'):
-                    subjects.append(item)
+            # scandir's cached entry type avoids a stat() per item
+            with os.scandir(output_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir() and not entry.name.startswith('.'):
+                        subjects.append(entry.name)
         except OSError as e:
             logging.error(f"Error reading output directory {output_dir}: {e}")
 
@@ -115,12 +179,13 @@ class AutoCategorizer:
             # Combine title and first part of transcript for matching
             content_sample = f"{video_title}. {transcript[:1000]}"
 
-            # Encode content and existing subjects
-            content_embedding = self.model.encode([content_sample])
-            subject_embeddings = self.model.encode(existing_subjects)
+            # Encode content and existing subjects in one batched forward pass
+            embeddings = self._encode([content_sample] + existing_subjects)
+            content_embedding = embeddings[:1]
+            subject_embeddings = embeddings[1:]
 
-            # Calculate similarities
-            similarities = cosine_similarity(content_embedding, subject_embeddings)[0]
+            # Rows are unit length, so cosine similarity is a plain dot product
+            similarities = subject_embeddings @ content_embedding[0]
 
             # Find best match above threshold
             best_idx = np.argmax(similarities)
@@ -135,6 +200,51 @@ class AutoCategorizer:
 
         return None
 
+    def _encode(self, texts: List[str]):
+        """
+        Encode texts as L2-normalized float32 rows.
+
+        Cached vectors are used where possible and the rest are encoded in
+        one batch.
+        """
+        if self.embedding_cache is None:
+            return self._normalize(self._model_encode(texts))
+
+        vectors = [self.embedding_cache.get(self.model_name, text) for text in texts]
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+
+        encoded = None
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            encoded = self._model_encode(missing_texts)
+            self.embedding_cache.put_many(self.model_name, missing_texts, encoded)
+
+        # Assemble hits and fresh encodes straight into one float32 block
+        dim = encoded.shape[1] if encoded is not None else len(vectors[0])
+        embeddings = np.empty((len(texts), dim), dtype=np.float32)
+        for i, vector in enumerate(vectors):
+            if vector is not None:
+                embeddings[i] = vector
+        if missing:
+            embeddings[missing] = encoded
+
+        return self._normalize(embeddings)
+
+    def _model_encode(self, texts: List[str]):
+        """Run the model without autograd bookkeeping."""
+        # inference_mode skips the version counters and view tracking that
+        # encode()'s own no_grad() still maintains
+        with torch.inference_mode():
+            return self.model.encode(texts, convert_to_numpy=True)
+
+    @staticmethod
+    def _normalize(embeddings):
+        """Convert embeddings to contiguous float32 rows of unit length (in place when possible)."""
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        embeddings /= np.maximum(norms, 1e-12)
+        return embeddings
+
     def _find_keyword_match(self, transcript: str, video_title: str,
                           existing_subjects: List[str]) -> Optional[str]:
         """Find match using keyword overlap (fallback method)."""
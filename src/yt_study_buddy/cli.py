@@ -19,9 +19,14 @@ from .assessment_generator import AssessmentGenerator
 from .auto_categorizer import AutoCategorizer
 from .job_logger import create_default_logger
 from .knowledge_graph import KnowledgeGraph
+from .llm_cache import LLMCache
 from .obsidian_linker import ObsidianLinker
 from .parallel_processor import ParallelVideoProcessor, ProcessingResult, ProcessingMetrics
-from .processing_pipeline import process_video_job
+from .processing_pipeline import (
+    DEFAULT_CLAUDE_CONCURRENCY,
+    process_video_job,
+    process_video_jobs_batched,
+)
 from .study_notes_generator import StudyNotesGenerator
 from .video_job import create_job_from_url
 from .video_processor import VideoProcessor
@@ -38,21 +43,26 @@ class YouTubeStudyNotes:
 
     def __init__(self, subject=None, global_context=True, base_dir="notes",
                  generate_assessments=True, auto_categorize=True,
-                 parallel=False, max_workers=3, export_pdf=False, pdf_theme='obsidian'):
+                 parallel=False, max_workers=3, export_pdf=False, pdf_theme='obsidian',
+                 use_llm_cache=True, use_batch_api=False):
         self.subject = subject
         self.global_context = global_context
         self.base_dir = base_dir
         self.output_dir = os.path.join(base_dir, subject) if subject else base_dir
         self.generate_assessments = generate_assessments
         self.auto_categorize = auto_categorize and not subject  # Only auto-categorize when no subject provided
+        self.use_batch_api = use_batch_api
         self.parallel = parallel
         self.max_workers = max_workers
         self.export_pdf = export_pdf
         self.pdf_theme = pdf_theme
 
+        # Persistent Claude response cache (skips repeat calls for the same transcript)
+        self.llm_cache = LLMCache() if use_llm_cache else None
+
         self.video_processor = VideoProcessor("tor")
         self.knowledge_graph = KnowledgeGraph(base_dir, subject, global_context)
-        self.notes_generator = StudyNotesGenerator()
+        self.notes_generator = StudyNotesGenerator(llm_cache=self.llm_cache)
         self.obsidian_linker = ObsidianLinker(base_dir, subject, global_context)
 
         # Initialize Tor coordinator for parallel processing
@@ -68,9 +78,18 @@ class YouTubeStudyNotes:
         else:
             self.tor_coordinator = None
 
+        # Batches share one output folder, so videos can't be categorized one by one
+        if self.use_batch_api and self.auto_categorize:
+            logger.warning("Auto-categorization is not available with --batch-api, "
+                           "saving to the base directory (use --subject to organize)")
+            self.auto_categorize = False
+
         # Initialize new components
         self.auto_categorizer = AutoCategorizer() if self.auto_categorize else None
-        self.assessment_generator = AssessmentGenerator(self.notes_generator.client) if generate_assessments else None
+        self.assessment_generator = (
+            AssessmentGenerator(self.notes_generator.client, llm_cache=self.llm_cache)
+            if generate_assessments else None
+        )
 
         # Initialize PDF exporter if requested
         if self.export_pdf:
@@ -92,6 +111,10 @@ class YouTubeStudyNotes:
         # Job logger for tracking all processing results
         self.job_logger = create_default_logger(Path(self.base_dir))
 
+        # Shared across workers so parallel jobs (each running notes and
+        # assessment calls) stay under the Claude API rate limit
+        self.claude_semaphore = threading.Semaphore(DEFAULT_CLAUDE_CONCURRENCY)
+
         # Unified processor: Always create ParallelVideoProcessor
         # When parallel=False, max_workers=1 provides sequential behavior
         self.parallel_processor = ParallelVideoProcessor(
@@ -180,7 +203,10 @@ class YouTubeStudyNotes:
 
                 # Update components with new subject (thread-safe)
                 with self._kg_lock:
-                    self.knowledge_graph = KnowledgeGraph(self.base_dir, detected_subject, self.global_context)
+                    self.knowledge_graph = KnowledgeGraph(
+                        self.base_dir, detected_subject, self.global_context,
+                        parse_cache=self.knowledge_graph.parse_cache
+                    )
                     self.obsidian_linker = ObsidianLinker(self.base_dir, detected_subject, self.global_context)
 
             except Exception as e:
@@ -210,16 +236,7 @@ class YouTubeStudyNotes:
             logger.debug("Using pre-fetched transcript from auto-categorization (skip fetch stage)")
 
         # Build components dict for pipeline
-        components = {
-            'video_processor': processor,
-            'notes_generator': self.notes_generator,
-            'assessment_generator': self.assessment_generator,
-            'obsidian_linker': self.obsidian_linker,
-            'pdf_exporter': self.pdf_exporter,
-            'job_logger': self.job_logger,
-            'output_dir': Path(current_output_dir),
-            'filename_sanitizer': processor.sanitize_filename
-        }
+        components = self._build_components(processor, Path(current_output_dir))
 
         # Process through stateless pipeline
         try:
@@ -229,16 +246,7 @@ class YouTubeStudyNotes:
             with self._kg_lock:
                 self.knowledge_graph.refresh_cache()
 
-            # Convert job to ProcessingResult
-            return ProcessingResult(
-                url=job.url,
-                video_id=job.video_id,
-                success=job.success,
-                title=job.video_title,
-                filepath=str(job.notes_filepath) if job.notes_filepath else None,
-                duration_seconds=job.processing_duration,
-                method=job.transcript_data.get('method', 'tor') if job.transcript_data else 'unknown'
-            )
+            return self._job_result(job)
 
         except Exception as e:
             logger.error(f"\nERROR processing {url}: {e}")
@@ -252,6 +260,72 @@ class YouTubeStudyNotes:
                 duration_seconds=job.processing_duration if hasattr(job, 'processing_duration') else 0
             )
 
+    def _build_components(self, processor, output_dir):
+        """Build the components dict passed to the processing pipeline."""
+        return {
+            'video_processor': processor,
+            'notes_generator': self.notes_generator,
+            'assessment_generator': self.assessment_generator,
+            'obsidian_linker': self.obsidian_linker,
+            'pdf_exporter': self.pdf_exporter,
+            'job_logger': self.job_logger,
+            'claude_semaphore': self.claude_semaphore,
+            'output_dir': output_dir,
+            'filename_sanitizer': processor.sanitize_filename
+        }
+
+    @staticmethod
+    def _job_result(job):
+        """Convert a processed job to a ProcessingResult."""
+        return ProcessingResult(
+            url=job.url,
+            video_id=job.video_id,
+            success=job.success,
+            title=job.video_title,
+            filepath=str(job.notes_filepath) if job.notes_filepath else None,
+            error=job.error,
+            duration_seconds=job.processing_duration,
+            method=job.transcript_data.get('method', 'tor') if job.transcript_data else 'unknown'
+        )
+
+    def process_urls_batched(self, urls):
+        """
+        Process URLs with all Claude calls sent through the Message Batches API.
+
+        Every transcript is fetched first, then notes and assessments go out
+        as one batch each. Batches cost less but can take minutes to hours to
+        finish, and small runs fall back to regular calls.
+
+        Args:
+            urls: YouTube URLs to process
+
+        Returns:
+            List of ProcessingResult
+        """
+        results = []
+        jobs = []
+
+        for url in urls:
+            video_id = self.video_processor.get_video_id(url)
+            if not video_id:
+                logger.error(f"ERROR: Invalid YouTube URL: {url}")
+                results.append(ProcessingResult(
+                    url=url,
+                    video_id="invalid",
+                    success=False,
+                    error="Invalid YouTube URL"
+                ))
+                continue
+            jobs.append(create_job_from_url(url, video_id, subject=self.subject))
+
+        components = self._build_components(self.video_processor, Path(self.output_dir))
+        process_video_jobs_batched(jobs, components)
+
+        self.knowledge_graph.refresh_cache()
+
+        results.extend(self._job_result(job) for job in jobs)
+        return results
+
     def _handle_rate_limit_error(self, e):
         """Handle rate limit errors with helpful message."""
         if "rate limit" in str(e).lower() or "429" in str(e) or "too many requests" in str(e).lower():
@@ -281,8 +355,14 @@ class YouTubeStudyNotes:
             logger.info(f"Subject: {self.subject}")
             logger.info(f"Cross-reference scope: {'Subject-only' if not self.global_context else 'Global'}")
 
+        # Load the categorizer model while the first transcript is being fetched
+        if self.auto_categorizer:
+            threading.Thread(target=self.auto_categorizer.warmup, daemon=True).start()
+
         # UNIFIED PROCESSING PATH: Single code path for both sequential and parallel modes
-        if self.parallel and self.tor_coordinator:
+        if self.use_batch_api:
+            results = self.process_urls_batched(urls)
+        elif self.parallel and self.tor_coordinator:
             # Parallel mode with Tor coordinator - synchronized access to single Tor daemon
             def process_with_coordinator_worker(url, worker_id):
                 """Process URL using Tor fetcher from coordinator."""
@@ -350,6 +430,9 @@ Options:
   --no-auto-categorize     Disable auto-categorization
   --export-pdf             Export notes to PDF with Obsidian-style formatting
   --pdf-theme <theme>      PDF theme: default, obsidian, academic, minimal (default: obsidian)
+  --no-llm-cache           Always call Claude, ignoring cached responses
+  --batch-api              Send Claude calls through the Message Batches API
+                           (cheaper for large runs, results can take hours)
   --help, -h               Show this help message
 
 Examples:
@@ -371,6 +454,9 @@ Examples:
   # Export with academic theme
   youtube-study-buddy --export-pdf --pdf-theme academic --file urls.txt
 
+  # Large playlist at batch pricing (20+ videos)
+  youtube-study-buddy --batch-api --subject "Machine Learning" --file urls.txt
+
 Performance:
   Sequential: ~60s per video
   Parallel (3 workers): ~25s per video (2.5x faster)
@@ -417,6 +503,9 @@ def main():
     parser.add_argument('--export-pdf', action='store_true', help='Export notes to PDF (requires: uv pip install weasyprint markdown2)')
     parser.add_argument('--pdf-theme', default='obsidian', choices=['default', 'obsidian', 'academic', 'minimal'],
                        help='PDF theme style (default: obsidian)')
+    parser.add_argument('--no-llm-cache', action='store_true', help='Disable the persistent Claude response cache')
+    parser.add_argument('--batch-api', action='store_true',
+                       help='Send Claude calls through the Message Batches API (slower, cheaper)')
     parser.add_argument('--debug-logging', action='store_true', help='Enable detailed debug logging to debug_logs/ directory')
     parser.add_argument('--help', '-h', action='store_true', help='Show help message')
 
@@ -444,7 +533,9 @@ def main():
         parallel=args.parallel,
         max_workers=args.workers,
         export_pdf=args.export_pdf,
-        pdf_theme=args.pdf_theme
+        pdf_theme=args.pdf_theme,
+        use_llm_cache=not args.no_llm_cache,
+        use_batch_api=args.batch_api
     )
 
     # Collect URLs from either command line or file
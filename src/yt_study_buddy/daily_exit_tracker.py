@@ -8,9 +8,11 @@ import json
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 from loguru import logger
 
+from .artifact_writer import write_atomic
+
 
 class DailyExitTracker:
     """Track daily exit node successes and failures."""
@@ -31,6 +33,11 @@ class DailyExitTracker:
         # In-memory tracking for current session
         self.today_date = datetime.now().strftime("%Y-%m-%d")
         self.attempts: List[Dict] = []  # [{exitNodeIp, videoId, attempt, success, timestamp}]
+        # Running aggregates, kept in sync with attempts so lookups and
+        # get_stats() don't rescan the whole day
+        self._failed_ips: Set[str] = set()
+        self._tried_ips: Set[str] = set()
+        self._successes = 0
 
         # Load existing data for today if available
         self._load_today_data()
@@ -48,6 +55,8 @@ class DailyExitTracker:
             # Check if data is for today
             if data.get('date') == self.today_date:
                 self.attempts = data.get('attempts', [])
+                for a in self.attempts:
+                    self._count_attempt(a['exitNodeIp'], a['success'])
                 logger.info(f"Loaded {len(self.attempts)} attempts from today's tracking")
             else:
                 logger.info(f"Previous tracking was for {data.get('date')}, starting fresh for {self.today_date}")
@@ -56,6 +65,17 @@ class DailyExitTracker:
         except Exception as e:
             logger.error(f"Failed to load daily tracking: {e}")
             self.attempts = []
+            self._failed_ips.clear()
+            self._tried_ips.clear()
+            self._successes = 0
+
+    def _count_attempt(self, exit_ip: str, success: bool):
+        """Update running aggregates for one attempt."""
+        self._tried_ips.add(exit_ip)
+        if success:
+            self._successes += 1
+        else:
+            self._failed_ips.add(exit_ip)
 
     def record_attempt(
         self,
@@ -83,9 +103,10 @@ class DailyExitTracker:
             }
 
             self.attempts.append(attempt_record)
+            self._count_attempt(exit_ip, success)
 
             status = "✓ success" if success else "✗ failure"
-            logger.debug(f"Recorded attempt: {exit_ip} for {video_id} (attempt {attempt}) - {status}")
+            logger.debug("Recorded attempt: {} for {} (attempt {}) - {}", exit_ip, video_id, attempt, status)
 
     def get_failed_ips_today(self) -> List[str]:
         """
@@ -95,12 +116,7 @@ class DailyExitTracker:
             List of IP addresses that had failures today
         """
         with self.lock:
-            failed_ips = set()
-            for attempt in self.attempts:
-                if not attempt['success']:
-                    failed_ips.add(attempt['exitNodeIp'])
-
-            return list(failed_ips)
+            return list(self._failed_ips)
 
     def has_failed_today(self, exit_ip: str) -> bool:
         """
@@ -113,10 +129,7 @@ class DailyExitTracker:
             True if this IP failed at least once today
         """
         with self.lock:
-            for attempt in self.attempts:
-                if attempt['exitNodeIp'] == exit_ip and not attempt['success']:
-                    return True
-            return False
+            return exit_ip in self._failed_ips
 
     def get_stats(self) -> Dict:
         """
@@ -127,11 +140,11 @@ class DailyExitTracker:
         """
         with self.lock:
             total = len(self.attempts)
-            successes = sum(1 for a in self.attempts if a['success'])
+            successes = self._successes
             failures = total - successes
 
-            unique_ips = set(a['exitNodeIp'] for a in self.attempts)
-            failed_ips = set(a['exitNodeIp'] for a in self.attempts if not a['success'])
+            unique_ips = self._tried_ips
+            failed_ips = self._failed_ips
 
             return {
                 'date': self.today_date,
@@ -153,12 +166,9 @@ class DailyExitTracker:
             }
 
             try:
-                # Write to temp file first, then rename (atomic on Unix)
-                temp_file = self.tracking_file.with_suffix('.tmp')
-                with open(temp_file, 'w') as f:
-                    json.dump(data, f, indent=2)
-
-                temp_file.replace(self.tracking_file)
+                # Temp file + rename, no fsync: a crash never leaves a
+                # truncated file, and a lost update only costs one attempt
+                write_atomic(self.tracking_file, json.dumps(data, indent=2), durable=False)
                 logger.debug(f"Saved {len(self.attempts)} attempts to {self.tracking_file}")
 
             except Exception as e:
@@ -0,0 +1,138 @@
+"""
+Persistent on-disk cache for sentence-transformer embeddings.
+
+Vectors are keyed by BLAKE2b of the text plus the model name and stored as
+raw float32 bytes in SQLite. A small in-process LRU sits in front of it,
+so subject names that are embedded for every video never reach the model
+(or the database) more than once per process.
+"""
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+DEFAULT_CACHE_FILE = Path.home() / '.cache' / 'yt_study_buddy' / 'embeddings.sqlite'
+
+
+class EmbeddingCache:
+    """
+    Thread-safe SQLite-backed cache of embedding vectors with an in-memory LRU.
+
+    One connection is opened on first use and kept for the life of the
+    instance; every database operation holds the instance lock, so it can
+    be shared by every worker thread.
+    """
+
+    def __init__(self, cache_file: Optional[Path] = None, memory_size: int = 4096):
+        """
+        Initialize embedding cache.
+
+        Args:
+            cache_file: SQLite database path (default: ~/.cache/yt_study_buddy/embeddings.sqlite)
+            memory_size: Maximum vectors kept in the in-process LRU
+        """
+        self.cache_file = Path(cache_file) if cache_file else DEFAULT_CACHE_FILE
+        self.memory_size = memory_size
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._ensure_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the shared connection, opening it on first use (call with lock held)."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.cache_file, timeout=30, check_same_thread=False)
+        return self._conn
+
+    def close(self):
+        """Close the database connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _ensure_schema(self):
+        """Create cache table if it doesn't exist."""
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS emb (k BLOB PRIMARY KEY, v BLOB NOT NULL)")
+
+    @staticmethod
+    def make_key(model_name: str, text: str) -> bytes:
+        """Build cache key for one text under one model."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(model_name.encode('utf-8') + b'\0')
+        digest.update(text.encode('utf-8'))
+        return digest.digest()
+
+    def _remember(self, key: bytes, vector):
+        """Insert into the in-process LRU, evicting the oldest entry if full."""
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def get(self, model_name: str, text: str):
+        """Get cached float32 vector, or None on miss."""
+        key = self.make_key(model_name, text)
+
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                return vector
+
+            try:
+                with self._connect() as conn:
+                    row = conn.execute("SELECT v FROM emb WHERE k = ?", (key,)).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache read failed: {e}")
+                return None
+
+            if row is None:
+                return None
+
+            vector = np.frombuffer(row[0], dtype=np.float32)
+            self._remember(key, vector)
+            return vector
+
+    def put(self, model_name: str, text: str, vector):
+        """Store a vector (converted to float32)."""
+        self.put_many(model_name, [text], [vector])
+
+    def put_many(self, model_name: str, texts, vectors):
+        """Store several vectors in one transaction."""
+        rows = []
+        with self._lock:
+            for text, vector in zip(texts, vectors):
+                key = self.make_key(model_name, text)
+                vector = np.asarray(vector, dtype=np.float32)
+                self._remember(key, vector)
+                rows.append((key, vector.tobytes()))
+
+            if not rows:
+                return
+
+            try:
+                with self._connect() as conn:
+                    conn.executemany("INSERT OR REPLACE INTO emb VALUES (?, ?)", rows)
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache write failed: {e}")
+
+    def clear(self):
+        """Remove all cached vectors."""
+        with self._lock:
+            self._memory.clear()
+            with self._connect() as conn:
+                conn.execute("DELETE FROM emb")
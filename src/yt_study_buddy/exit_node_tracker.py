@@ -8,9 +8,11 @@ import threading
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 from loguru import logger
 
+from .artifact_writer import write_atomic
+
 
 def humanize_timedelta(td: timedelta) -> str:
     """
@@ -142,14 +144,12 @@ class ExitNodeTracker:
     def _save(self) -> None:
         """Save exit node data to JSON file (must be called with lock held)."""
         try:
-            # Write atomically: write to temp file, then rename
-            temp_path = self.log_path.with_suffix('.json.tmp')
-
-            with open(temp_path, 'w') as f:
-                json.dump(self._data, f, indent=2, sort_keys=True)
-
-            # Atomic rename
-            temp_path.replace(self.log_path)
+            # Runs on every record_use: temp file + rename, no per-use fsync
+            write_atomic(
+                self.log_path,
+                json.dumps(self._data, indent=2, sort_keys=True),
+                durable=False
+            )
 
         except Exception as e:
             logger.error(f"⚠️  Error saving log: {e}")
@@ -179,28 +179,46 @@ class ExitNodeTracker:
 
         return len(expired_ips)
 
-    def is_available(self, exit_ip: str) -> bool:
+    def _remaining_cooldown(self, exit_ip: str) -> Optional[float]:
+        """Seconds of cooldown left for an IP, or None if available (call with lock held)."""
+        info = self._data.get(exit_ip)
+        if info is None:
+            return None  # Never used, available
+
+        try:
+            last_used = datetime.fromisoformat(info['last_used'])
+        except (KeyError, ValueError):
+            # Invalid entry, consider it available
+            return None
+
+        remaining = self.cooldown_seconds - (datetime.now() - last_used).total_seconds()
+        return remaining if remaining > 0 else None
+
+    def check(self, exit_ip: str) -> Tuple[bool, Optional[float]]:
         """
-        Check if an exit IP is available (not in cooldown).
+        Check availability and remaining cooldown of an exit IP in one read.
 
         Args:
             exit_ip: Exit IP address to check
 
         Returns:
-            True if IP is available (not used recently), False if in cooldown
+            Tuple of (available, remaining seconds in cooldown or None if available)
         """
         with self._lock:
-            if exit_ip not in self._data:
-                return True  # Never used, available
+            remaining = self._remaining_cooldown(exit_ip)
+        return remaining is None, remaining
 
-            try:
-                last_used = datetime.fromisoformat(self._data[exit_ip]['last_used'])
-                elapsed = (datetime.now() - last_used).total_seconds()
-                return elapsed >= self.cooldown_seconds
+    def is_available(self, exit_ip: str) -> bool:
+        """
+        Check if an exit IP is available (not in cooldown).
 
-            except (KeyError, ValueError):
-                # Invalid entry, consider it available
-                return True
+        Args:
+            exit_ip: Exit IP address to check
+
+        Returns:
+            True if IP is available (not used recently), False if in cooldown
+        """
+        return self.check(exit_ip)[0]
 
     def get_cooldown_remaining(self, exit_ip: str) -> Optional[float]:
         """
@@ -212,18 +230,7 @@ class ExitNodeTracker:
         Returns:
             Remaining seconds in cooldown, or None if available
         """
-        with self._lock:
-            if exit_ip not in self._data:
-                return None
-
-            try:
-                last_used = datetime.fromisoformat(self._data[exit_ip]['last_used'])
-                elapsed = (datetime.now() - last_used).total_seconds()
-                remaining = self.cooldown_seconds - elapsed
-                return max(0, remaining) if remaining > 0 else None
-
-            except (KeyError, ValueError):
-                return None
+        return self.check(exit_ip)[1]
 
     def get_time_since_last_use(self, exit_ip: str) -> Optional[str]:
         """
@@ -265,9 +272,9 @@ class ExitNodeTracker:
             True if recorded successfully, False if IP is in cooldown and force=False
         """
         with self._lock:
-            # Check cooldown
-            if not force and not self.is_available(exit_ip):
-                remaining = self.get_cooldown_remaining(exit_ip)
+            # Check cooldown (the lock is already held, so use the unlocked helper)
+            remaining = None if force else self._remaining_cooldown(exit_ip)
+            if remaining is not None:
                 print(f"⚠️  Exit IP {exit_ip} still in cooldown "
                       f"({remaining:.0f}s remaining)")
                 return False
@@ -308,7 +315,10 @@ class ExitNodeTracker:
         Returns:
             List of IPs that are not in cooldown
         """
-        return [ip for ip in candidate_ips if self.is_available(ip)]
+        # One lock acquisition and one clock read for the whole batch,
+        # rather than per candidate via is_available()
+        unavailable = self.get_unavailable_ips()
+        return [ip for ip in candidate_ips if ip not in unavailable]
 
     def get_unavailable_ips(self) -> Set[str]:
         """
@@ -318,19 +328,23 @@ class ExitNodeTracker:
             Set of IP addresses in cooldown period
         """
         with self._lock:
-            now = datetime.now()
-            unavailable = set()
+            return self._unavailable_ips()
+
+    def _unavailable_ips(self) -> Set[str]:
+        """Collect IPs in cooldown (call with lock held)."""
+        now = datetime.now()
+        unavailable = set()
 
-            for ip, info in self._data.items():
-                try:
-                    last_used = datetime.fromisoformat(info['last_used'])
-                    elapsed = (now - last_used).total_seconds()
-                    if elapsed < self.cooldown_seconds:
-                        unavailable.add(ip)
-                except (KeyError, ValueError):
-                    pass
+        for ip, info in self._data.items():
+            try:
+                last_used = datetime.fromisoformat(info['last_used'])
+                elapsed = (now - last_used).total_seconds()
+                if elapsed < self.cooldown_seconds:
+                    unavailable.add(ip)
+            except (KeyError, ValueError):
+                pass
 
-            return unavailable
+        return unavailable
 
     def get_stats(self) -> Dict:
         """
@@ -340,7 +354,7 @@ class ExitNodeTracker:
             Dictionary with tracking statistics
         """
         with self._lock:
-            unavailable = self.get_unavailable_ips()
+            unavailable = self._unavailable_ips()
 
             stats = {
                 'total_tracked': len(self._data),
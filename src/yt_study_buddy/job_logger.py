@@ -4,11 +4,14 @@ Job logging system for tracking video processing results.
 Appends job results to a JSON array file with complete metadata and errors.
 """
 import json
+import textwrap
 import threading
+from collections import Counter
 from pathlib import Path
 from typing import List, Optional
 from datetime import datetime
 
+from .artifact_writer import write_atomic
 from .video_job import VideoProcessingJob
 
 
@@ -46,9 +49,42 @@ class JobLogger:
             return []
 
     def _write_jobs(self, jobs: List[dict]):
-        """Write jobs array to log file."""
-        with open(self.log_file, 'w', encoding='utf-8') as f:
-            json.dump(jobs, f, indent=2, ensure_ascii=False)
+        """Write jobs array to log file atomically (temp file, fsync, rename)."""
+        write_atomic(self.log_file, json.dumps(jobs, indent=2, ensure_ascii=False))
+
+    def _append_jobs(self, new_jobs: List[dict]) -> bool:
+        """
+        Append jobs by copying the existing text up to its closing bracket.
+
+        Produces the same layout as _write_jobs() without parsing and
+        re-serializing every earlier entry (each one carries a transcript).
+        The new file goes through write_atomic, so a crash mid-append leaves
+        the previous log intact instead of one without its closing bracket.
+
+        Returns:
+            False if the file is missing or doesn't end in ']' (caller
+            should fall back to a full rewrite)
+        """
+        try:
+            existing = self.log_file.read_bytes().rstrip()
+        except FileNotFoundError:
+            return False
+
+        if not existing.endswith(b']'):
+            return False
+
+        before = existing[:-1].rstrip()
+        if not before:
+            return False
+
+        body = ',\n'.join(
+            textwrap.indent(json.dumps(job, indent=2, ensure_ascii=False), '  ')
+            for job in new_jobs
+        )
+        separator = '\n' if before.endswith(b'[') else ',\n'
+
+        write_atomic(self.log_file, [before, separator, body, '\n]'])
+        return True
 
     def log_job(self, job: VideoProcessingJob):
         """
@@ -60,11 +96,12 @@ class JobLogger:
             job: Completed VideoProcessingJob to log
         """
         with self._lock:
-            jobs = self._read_jobs()
             job_data = job.to_json()
             job_data['logged_at'] = datetime.now().isoformat()
-            jobs.append(job_data)
-            self._write_jobs(jobs)
+            if not self._append_jobs([job_data]):
+                jobs = self._read_jobs()
+                jobs.append(job_data)
+                self._write_jobs(jobs)
 
     def log_jobs_batch(self, jobs: List[VideoProcessingJob]):
         """
@@ -75,16 +112,20 @@ class JobLogger:
         Args:
             jobs: List of VideoProcessingJob instances to log
         """
+        if not jobs:
+            return
+
         with self._lock:
-            existing_jobs = self._read_jobs()
             logged_at = datetime.now().isoformat()
 
+            new_jobs = []
             for job in jobs:
                 job_data = job.to_json()
                 job_data['logged_at'] = logged_at
-                existing_jobs.append(job_data)
+                new_jobs.append(job_data)
 
-            self._write_jobs(existing_jobs)
+            if not self._append_jobs(new_jobs):
+                self._write_jobs(self._read_jobs() + new_jobs)
 
     def get_all_jobs(self) -> List[dict]:
         """
@@ -151,33 +192,38 @@ class JobLogger:
                     'error_types': {}
                 }
 
-            successful = [j for j in jobs if j.get('success', False)]
-            failed = [j for j in jobs if not j.get('success', False)]
-
-            # Calculate average duration for successful jobs
-            durations = [j['processing_duration'] for j in successful
-                        if j.get('processing_duration')]
-            avg_duration = sum(durations) / len(durations) if durations else None
+            # Single pass over the log; each entry is a large dict
+            successful = 0
+            total_files = 0
+            duration_sum = 0.0
+            duration_count = 0
+            error_types = Counter()
+            stages = Counter()
 
-            # Count error types
-            error_types = {}
-            for job in failed:
-                error = job.get('error', 'Unknown error')
-                error_type = error.split(':')[0] if ':' in error else error
-                error_types[error_type] = error_types.get(error_type, 0) + 1
+            for job in jobs:
+                stages[job.get('stage')] += 1
+
+                if job.get('success', False):
+                    successful += 1
+                    total_files += job.get('total_files', 0)
+                    duration = job.get('processing_duration')
+                    if duration:
+                        duration_sum += duration
+                        duration_count += 1
+                else:
+                    error = job.get('error', 'Unknown error')
+                    error_type = error.split(':')[0] if ':' in error else error
+                    error_types[error_type] += 1
 
             return {
                 'total_jobs': len(jobs),
-                'successful': len(successful),
-                'failed': len(failed),
-                'success_rate': len(successful) / len(jobs) if jobs else 0,
-                'average_duration': avg_duration,
-                'total_files_created': sum(j.get('total_files', 0) for j in successful),
-                'error_types': error_types,
-                'stages': {
-                    stage: len([j for j in jobs if j.get('stage') == stage])
-                    for stage in set(j.get('stage') for j in jobs)
-                }
+                'successful': successful,
+                'failed': len(jobs) - successful,
+                'success_rate': successful / len(jobs),
+                'average_duration': duration_sum / duration_count if duration_count else None,
+                'total_files_created': total_files,
+                'error_types': dict(error_types),
+                'stages': dict(stages)
             }
 
     def clear_log(self):
@@ -1,19 +1,108 @@
 """
 Knowledge graph for managing concept indexing and cross-references between study notes.
 """
+import hashlib
+import heapq
 import os
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 from loguru import logger
 
+# Threads used to read notes while building the concept index
+INDEX_WORKERS = 8
+
+# Patterns used on every note during indexing, compiled once
+_TITLE_PATTERN = re.compile(r'^# (.+)$', re.MULTILINE)
+_BULLET_PATTERN = re.compile(r'[-*•]\s*(.+?)(?=\n|$)')
+_NUMBERED_PATTERN = re.compile(r'\d+\.\s*(.+?)(?=\n|$)')
+_BOLD_TERM_PATTERN = re.compile(r'\*\*([^*]+)\*\*')
+_BULLET_TERM_PATTERN = re.compile(r'[-*•]\s*([^:]+):')
+_CAPITALIZED_PHRASE_PATTERN = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+
+# Lines that end a section (any heading level 2+, or a horizontal rule)
+_SECTION_BOUNDARY_PREFIXES = ('##', '---')
+
+# Most notes kept in a NoteParseCache before the least recently used is dropped
+PARSE_CACHE_SIZE = 4096
+
+
+def _iter_sections(content):
+    """
+    Yield (heading line, body) for every '##'/'---' delimited section.
+
+    One forward pass over the lines with str.startswith, which beats a
+    MULTILINE regex scan for this simple line-prefix test.
+    """
+    heading = None
+    body_lines = []
+    for line in content.split('\n'):
+        if line.startswith(_SECTION_BOUNDARY_PREFIXES):
+            if heading is not None:
+                yield heading, '\n'.join(body_lines)
+            heading = line
+            body_lines = []
+        elif heading is not None:
+            body_lines.append(line)
+    if heading is not None:
+        yield heading, '\n'.join(body_lines)
+
+
+class NoteParseCache:
+    """
+    Thread-safe LRU of parsed notes by path.
+
+    Entries are ((st_mtime_ns, st_size), content digest, (title, concepts)
+    or None), so refresh_cache() only re-reads notes whose stat changed, and
+    only re-parses if the bytes did too.
+    """
+
+    def __init__(self, max_size: int = PARSE_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        """Get the cached entry for path, or None."""
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None:
+                self._entries.move_to_end(path)
+            return entry
+
+    def put(self, path, entry):
+        """Store an entry, evicting the least recently used if full."""
+        with self._lock:
+            self._entries[path] = entry
+            self._entries.move_to_end(path)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
 
 class KnowledgeGraph:
     """Manages concept extraction and relationship finding between study notes."""
 
-    def __init__(self, base_dir="notes", subject=None, global_context=True):
+    def __init__(self, base_dir="notes", subject=None, global_context=True, parse_cache=None):
+        """
+        Initialize knowledge graph.
+
+        Args:
+            base_dir: Root notes directory
+            subject: Subject folder to scope to (None for base_dir)
+            global_context: Index every subject rather than only this one
+            parse_cache: NoteParseCache to reuse, e.g. from the graph this one
+                         replaces (a new one is created if omitted)
+        """
         self.base_dir = base_dir
         self.subject = subject
         self.global_context = global_context
         self.subject_dir = os.path.join(base_dir, subject) if subject else base_dir
+        self.parse_cache = parse_cache if parse_cache is not None else NoteParseCache()
         self._concepts_cache = None
         self._global_cache = None
 
@@ -33,10 +122,11 @@ class KnowledgeGraph:
         dirs_to_scan = []
         if use_global and os.path.exists(self.base_dir):
             # Scan all subjects for global context
-            for item in os.listdir(self.base_dir):
-                item_path = os.path.join(self.base_dir, item)
-                if os.path.isdir(item_path):
-                    dirs_to_scan.append((item_path, item))  # (path, subject)
+            # scandir's cached entry type avoids a stat() per item
+            with os.scandir(self.base_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        dirs_to_scan.append((entry.path, entry.name))  # (path, subject)
             # Also scan base directory for any loose files
             dirs_to_scan.append((self.base_dir, None))
         else:
@@ -44,61 +134,90 @@ class KnowledgeGraph:
             if os.path.exists(self.subject_dir):
                 dirs_to_scan.append((self.subject_dir, self.subject))
 
+        note_files = []
         for dir_path, subject_name in dirs_to_scan:
             if not os.path.exists(dir_path):
                 continue
 
             for filename in os.listdir(dir_path):
-                if not filename.endswith('.md'):
-                    continue
+                if filename.endswith('.md'):
+                    note_files.append((os.path.join(dir_path, filename), filename, subject_name))
 
-                filepath = os.path.join(dir_path, filename)
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        content = f.read()
-
-                    # Extract title (first line after #)
-                    title_match = re.search(r'^# (.+)$', content, re.MULTILINE)
-                    if not title_match:
-                        continue
-
-                    title = title_match.group(1).strip()
-                    concepts = self._extract_concepts_from_content(content)
-
-                    if concepts:
-                        concepts_index[title] = {
-                            'filename': filename,
-                            'subject': subject_name,
-                            'path': filepath,
-                            'concepts': list(concepts)[:10]  # Limit to top 10 concepts
-                        }
-
-                except Exception as e:
-                    logger.error(f"Warning: Could not process {filename}: {e}")
+        # Reading is I/O-bound, so overlap it across a few threads; results
+        # are consumed in listing order so the index is built deterministically
+        with ThreadPoolExecutor(max_workers=INDEX_WORKERS, thread_name_prefix='kg-index') as executor:
+            parsed_notes = executor.map(self._parse_note, (filepath for filepath, _, _ in note_files))
+
+            for (filepath, filename, subject_name), parsed in zip(note_files, parsed_notes):
+                if parsed is None:
                     continue
 
+                title, concepts = parsed
+                if concepts:
+                    concepts_index[title] = {
+                        'filename': filename,
+                        'subject': subject_name,
+                        'path': filepath,
+                        'concepts': list(concepts)[:10]  # Limit to top 10 concepts
+                    }
+
         # Cache the results
         setattr(self, cache_key, concepts_index)
         return concepts_index
 
+    def _parse_note(self, filepath):
+        """Read one note and extract (title, concepts), or None if unusable."""
+        try:
+            # Stat first: an unchanged note is served without reading it
+            st = os.stat(filepath)
+            signature = (st.st_mtime_ns, st.st_size)
+            cached = self.parse_cache.get(filepath)
+            if cached is not None and cached[0] == signature:
+                return cached[2]
+
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+
+            # Touched but identical (e.g. rewritten by the linker or a sync tool)
+            digest = hashlib.blake2b(raw, digest_size=16).digest()
+            if cached is not None and cached[1] == digest:
+                self.parse_cache.put(filepath, (signature, digest, cached[2]))
+                return cached[2]
+
+            content = raw.decode('utf-8')
+
+            # Extract title (first line after #)
+            title_match = _TITLE_PATTERN.search(content)
+            if title_match:
+                parsed = title_match.group(1).strip(), self._extract_concepts_from_content(content)
+            else:
+                parsed = None
+
+            self.parse_cache.put(filepath, (signature, digest, parsed))
+            return parsed
+
+        except Exception as e:
+            logger.error(f"Warning: Could not process {os.path.basename(filepath)}: {e}")
+            return None
+
     def _extract_concepts_from_content(self, content):
         """Extract concepts from markdown content."""
         concepts = set()
 
-        # Look for Core Concepts section
-        core_concepts_match = re.search(r'## Core Concepts\n(.*?)(?=\n##|\n---|\Z)', content, re.DOTALL)
-        if core_concepts_match:
-            concepts.update(self._extract_from_section(core_concepts_match.group(1)))
-
-        # Look for Definitions & Terminology
-        defs_match = re.search(r'## Definitions & Terminology\n(.*?)(?=\n##|\n---|\Z)', content, re.DOTALL)
-        if defs_match:
-            concepts.update(self._extract_definitions(defs_match.group(1)))
-
-        # Look for Key Points section for additional concepts
-        key_points_match = re.search(r'## Key Points\n(.*?)(?=\n##|\n---|\Z)', content, re.DOTALL)
-        if key_points_match:
-            concepts.update(self._extract_key_phrases(key_points_match.group(1)))
+        # Core Concepts, Definitions & Terminology, and Key Points (for
+        # additional concepts) - first occurrence of each at any heading
+        # level from '##' down, in one pass
+        extractors = {
+            'Core Concepts': self._extract_from_section,
+            'Definitions & Terminology': self._extract_definitions,
+            'Key Points': self._extract_key_phrases,
+        }
+        for heading, body in _iter_sections(content):
+            extract = extractors.pop(heading.lstrip('#').removeprefix(' '), None)
+            if extract:
+                concepts.update(extract(body))
+                if not extractors:
+                    break
 
         return concepts
 
@@ -106,8 +225,8 @@ class KnowledgeGraph:
         """Extract concepts from a general section (bullet points, numbered items)."""
         concepts = set()
         # Extract bullet points and numbered items
-        concept_lines = re.findall(r'[-*•]\s*(.+?)(?=\n|$)', section_text)
-        concept_lines.extend(re.findall(r'\d+\.\s*(.+?)(?=\n|$)', section_text))
+        concept_lines = _BULLET_PATTERN.findall(section_text)
+        concept_lines.extend(_NUMBERED_PATTERN.findall(section_text))
 
         for line in concept_lines:
             # Take first few words as concept
@@ -121,8 +240,8 @@ class KnowledgeGraph:
         """Extract defined terms from definitions section."""
         concepts = set()
         # Extract defined terms (usually in bold or as list items)
-        terms = re.findall(r'\*\*([^*]+)\*\*', defs_text)
-        terms.extend(re.findall(r'[-*•]\s*([^:]+):', defs_text))
+        terms = _BOLD_TERM_PATTERN.findall(defs_text)
+        terms.extend(_BULLET_TERM_PATTERN.findall(defs_text))
 
         for term in terms:
             clean_term = term.strip().lower()
@@ -135,7 +254,7 @@ class KnowledgeGraph:
         """Extract important phrases from key points section."""
         concepts = set()
         # Extract important phrases (capitalized words, technical terms)
-        important_phrases = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', key_text)
+        important_phrases = _CAPITALIZED_PHRASE_PATTERN.findall(key_text)
 
         for phrase in important_phrases:
             if len(phrase) > 3 and phrase.lower() not in ['The', 'This', 'That', 'With', 'From']:
@@ -175,9 +294,8 @@ class KnowledgeGraph:
                     'matching_concepts': matching_concepts[:3]  # Top 3 matches
                 })
 
-        # Sort by relevance and return top 5
-        related_notes.sort(key=lambda x: x['relevance_score'], reverse=True)
-        return related_notes[:5]
+        # Top 5 by relevance (partial selection - the index can hold many notes)
+        return heapq.nlargest(5, related_notes, key=lambda x: x['relevance_score'])
 
     def refresh_cache(self):
         """Force refresh both concept caches."""
@@ -0,0 +1,272 @@
+"""
+Persistent on-disk cache for Claude responses.
+
+Responses are keyed by SHA-256 of (prompt version, model, max_tokens, prompt)
+and stored zlib-compressed in SQLite, so re-running a video after a failure
+or re-processing a playlist does not pay for the same LLM call twice.
+
+Also provides batched_completion for submitting many prompts through the
+Message Batches API (cheaper, higher throughput, same cache).
+"""
+import hashlib
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Optional
+
+from loguru import logger
+
+# Bump when prompt templates change in a way that should invalidate old
+# responses (the prompt text itself is already part of the key)
+PROMPT_CACHE_VERSION = 1
+
+DEFAULT_CACHE_FILE = Path.home() / '.cache' / 'yt_study_buddy' / 'llm_cache.sqlite'
+
+
+class LLMCache:
+    """
+    Thread-safe SQLite-backed cache of LLM responses.
+
+    One connection is opened on first use and kept for the life of the
+    instance; every operation holds the instance lock, so it can be shared
+    by every worker thread.
+    """
+
+    def __init__(self, cache_file: Optional[Path] = None):
+        """
+        Initialize LLM cache.
+
+        Args:
+            cache_file: SQLite database path (default: ~/.cache/yt_study_buddy/llm_cache.sqlite)
+        """
+        self.cache_file = Path(cache_file) if cache_file else DEFAULT_CACHE_FILE
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+        self._ensure_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the shared connection, opening it on first use (call with lock held)."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.cache_file, timeout=30, check_same_thread=False)
+        return self._conn
+
+    def close(self):
+        """Close the database connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _ensure_schema(self):
+        """Create cache table if it doesn't exist."""
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    response BLOB NOT NULL,
+                    created_at REAL NOT NULL,
+                    input_tokens INTEGER,
+                    output_tokens INTEGER
+                )
+            """)
+
+    @staticmethod
+    def make_key(model: str, prompt: str, max_tokens: int) -> str:
+        """Build cache key for a single-prompt completion."""
+        digest = hashlib.sha256()
+        digest.update(f"{PROMPT_CACHE_VERSION}\0{model}\0{max_tokens}\0".encode('utf-8'))
+        digest.update(prompt.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get cached response text, or None on miss."""
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return zlib.decompress(row[0]).decode('utf-8')
+
+    def put(self, key: str, model: str, response: str,
+            input_tokens: Optional[int] = None, output_tokens: Optional[int] = None):
+        """Store response text."""
+        blob = zlib.compress(response.encode('utf-8'), 6)
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, blob, time.time(), input_tokens, output_tokens)
+            )
+
+    def clear(self):
+        """Remove all cached responses."""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        with self._lock, self._connect() as conn:
+            entries, output_tokens = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(output_tokens), 0) FROM responses"
+            ).fetchone()
+
+        return {
+            'entries': entries,
+            'cached_output_tokens': output_tokens,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+def cached_completion(client, model: str, prompt: str, max_tokens: int,
+                      cache: Optional[LLMCache] = None) -> str:
+    """
+    Run a single-prompt Claude completion, consulting the cache first.
+
+    Args:
+        client: Anthropic client
+        model: Model name
+        prompt: User prompt
+        max_tokens: Maximum response tokens
+        cache: Optional LLMCache (no caching if None)
+
+    Returns:
+        Response text
+    """
+    key = None
+    if cache is not None:
+        key = cache.make_key(model, prompt, max_tokens)
+        try:
+            cached = cache.get(key)
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache read failed: {e}")
+            cached = None
+        if cached is not None:
+            logger.debug("LLM cache hit ({})", model)
+            return cached
+
+    message = client.messages.create(
+        model=model,
+        max_tokens=max_tokens,
+        messages=[{
+            "role": "user",
+            "content": prompt
+        }]
+    )
+    text = message.content[0].text
+
+    if cache is not None:
+        usage = getattr(message, 'usage', None)
+        input_tokens = getattr(usage, 'input_tokens', None)
+        output_tokens = getattr(usage, 'output_tokens', None)
+        try:
+            cache.put(
+                key, model, text,
+                input_tokens=input_tokens if isinstance(input_tokens, int) else None,
+                output_tokens=output_tokens if isinstance(output_tokens, int) else None
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+    return text
+
+
+def batched_completion(client, model: str, prompts: Dict[str, str], max_tokens: int,
+                       cache: Optional[LLMCache] = None,
+                       poll_interval: float = 30.0,
+                       timeout: float = 24 * 3600) -> Dict[str, str]:
+    """
+    Run many single-prompt completions as one Message Batches submission.
+
+    Cached prompts are answered locally; only misses are submitted. Requests
+    that error or expire are left out of the result so callers can fall back
+    to per-call generation for them.
+
+    Args:
+        client: Anthropic client
+        model: Model name
+        prompts: Mapping of custom_id (e.g., video ID) -> prompt
+        max_tokens: Maximum response tokens per request
+        cache: Optional LLMCache
+        poll_interval: Seconds between batch status checks
+        timeout: Maximum seconds to wait for the batch to end
+
+    Returns:
+        Mapping of custom_id -> response text for successful requests
+    """
+    results: Dict[str, str] = {}
+    keys: Dict[str, str] = {}
+    pending: Dict[str, str] = {}
+
+    for custom_id, prompt in prompts.items():
+        if cache is not None:
+            keys[custom_id] = cache.make_key(model, prompt, max_tokens)
+            try:
+                cached = cache.get(keys[custom_id])
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache read failed: {e}")
+                cached = None
+            if cached is not None:
+                results[custom_id] = cached
+                continue
+        pending[custom_id] = prompt
+
+    if not pending:
+        return results
+
+    batch = client.messages.batches.create(requests=[
+        {
+            "custom_id": custom_id,
+            "params": {
+                "model": model,
+                "max_tokens": max_tokens,
+                "messages": [{"role": "user", "content": prompt}]
+            }
+        }
+        for custom_id, prompt in pending.items()
+    ])
+    logger.info(f"Submitted message batch {batch.id} ({len(pending)} requests)")
+
+    deadline = time.time() + timeout
+    while batch.processing_status != "ended":
+        if time.time() > deadline:
+            logger.error(f"Message batch {batch.id} did not finish in {timeout:.0f}s, cancelling")
+            client.messages.batches.cancel(batch.id)
+            return results
+        time.sleep(poll_interval)
+        batch = client.messages.batches.retrieve(batch.id)
+
+    for entry in client.messages.batches.results(batch.id):
+        if entry.result.type != "succeeded":
+            logger.warning(f"  Batch request {entry.custom_id} {entry.result.type}")
+            continue
+
+        message = entry.result.message
+        text = message.content[0].text
+        results[entry.custom_id] = text
+
+        if cache is not None:
+            usage = getattr(message, 'usage', None)
+            input_tokens = getattr(usage, 'input_tokens', None)
+            output_tokens = getattr(usage, 'output_tokens', None)
+            try:
+                cache.put(
+                    keys[entry.custom_id], model, text,
+                    input_tokens=input_tokens if isinstance(input_tokens, int) else None,
+                    output_tokens=output_tokens if isinstance(output_tokens, int) else None
+                )
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache write failed: {e}")
+
+    return results
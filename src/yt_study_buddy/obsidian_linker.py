@@ -4,14 +4,25 @@ Handles fuzzy matching and prevents nested linking issues.
 """
 import os
 import re
+from bisect import bisect_left, bisect_right
 
 from loguru import logger
 
 try:
-    from fuzzywuzzy import fuzz, process
+    from fuzzywuzzy import fuzz, process, utils as fuzz_utils
 except ImportError:
     fuzz = None
     process = None
+    fuzz_utils = None
+
+# Patterns used on every sentence of every note, compiled once
+_TITLE_PATTERN = re.compile(r'^# (.+)$', re.MULTILINE)
+_WIKI_LINK_PATTERN = re.compile(r'\[\[([^\]]+)\]\]')
+_SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]+')
+_CAPITALIZED_PHRASE_PATTERN = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+_CAMEL_CASE_PATTERN = re.compile(r'\b[a-z]+(?:[A-Z][a-z]*)+\b')
+_QUOTED_PATTERN = re.compile(r'"([^"]+)"')
+_PARENTHETICAL_PATTERN = re.compile(r'\(([^)]+)\)')
 
 
 class ObsidianLinker:
@@ -23,6 +34,8 @@ class ObsidianLinker:
         self.global_context = global_context
         self.min_similarity = min_similarity
         self.note_titles = {}  # Cache of {title: (file_path, subject)}
+        self._title_lengths = []
+        self._title_lengths_source = None  # note_titles dict _title_lengths was built from
 
     def build_note_index(self):
         """Build an index of all available note titles for linking."""
@@ -32,10 +45,11 @@ class ObsidianLinker:
         dirs_to_scan = []
         if self.global_context and os.path.exists(self.base_dir):
             # Scan all subjects for global context
-            for item in os.listdir(self.base_dir):
-                item_path = os.path.join(self.base_dir, item)
-                if os.path.isdir(item_path):
-                    dirs_to_scan.append((item_path, item))  # (path, subject)
+            # scandir's cached entry type avoids a stat() per item
+            with os.scandir(self.base_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        dirs_to_scan.append((entry.path, entry.name))  # (path, subject)
             # Also scan base directory for any loose files
             dirs_to_scan.append((self.base_dir, None))
         else:
@@ -59,7 +73,7 @@ class ObsidianLinker:
                         content = f.read()
 
                     # Extract title (first line after #)
-                    title_match = re.search(r'^# (.+)$', content, re.MULTILINE)
+                    title_match = _TITLE_PATTERN.search(content)
                     if title_match:
                         title = title_match.group(1).strip()
                         self.note_titles[title] = {
@@ -72,10 +86,47 @@ class ObsidianLinker:
                     logger.error(f"Warning: Could not process {filename} for linking: {e}")
                     continue
 
+    @staticmethod
+    def _match_length(text):
+        """Length of text as token_sort_ratio compares it (processed, tokens re-joined)."""
+        return len(' '.join(fuzz_utils.full_process(text, force_ascii=True).split()))
+
+    def _get_title_lengths(self):
+        """Get the sorted processed lengths of all note titles."""
+        if self._title_lengths_source is not self.note_titles:
+            self._title_lengths = sorted(self._match_length(title) for title in self.note_titles)
+            self._title_lengths_source = self.note_titles
+        return self._title_lengths
+
+    def could_match_title(self, phrase):
+        """
+        Cheap pre-filter: could phrase reach min_similarity against any title?
+
+        A similarity ratio is at most 2 * min(a, b) / (a + b) for strings of
+        lengths a and b, so a phrase can only score min_similarity against
+        titles whose length falls in a window around its own. One bisect on
+        the sorted title lengths rules out phrases with no title in that
+        window. Unlike a shared-word check this never rejects a match the
+        fuzzy scorer would accept (e.g. plurals like Transformer/Transformers).
+        """
+        # Scores are rounded to whole percent, so allow half a point below
+        cutoff = (self.min_similarity - 0.5) / 100
+        if cutoff <= 0:
+            return True
+
+        length = self._match_length(phrase)
+        if not length:
+            return False
+
+        title_lengths = self._get_title_lengths()
+        lo = bisect_left(title_lengths, length * cutoff / (2 - cutoff))
+        hi = bisect_right(title_lengths, length * (2 - cutoff) / cutoff)
+        return lo < hi
+
     def extract_existing_links(self, content):
         """Extract existing Obsidian links to avoid double-linking."""
         # Find all existing [[links]]
-        existing_links = re.findall(r'\[\[([^\]]+)\]\]', content)
+        existing_links = _WIKI_LINK_PATTERN.findall(content)
         return set(existing_links)
 
     def find_potential_links(self, content, exclude_current_title=None):
@@ -97,7 +148,7 @@ class ObsidianLinker:
         potential_links = []
 
         # Split content into sentences and phrases for analysis
-        sentences = re.split(r'[.!?]+', content)
+        sentences = _SENTENCE_SPLIT_PATTERN.split(content)
 
         for sentence in sentences:
             # Skip if sentence is too short or is already a header/link
@@ -113,6 +164,10 @@ class ObsidianLinker:
                 if phrase in existing_links:
                     continue
 
+                # Skip fuzzy matching for phrases no title is close enough in length to
+                if not self.could_match_title(phrase):
+                    continue
+
                 # Find best matches using fuzzy matching
                 matches = process.extractBests(
                     phrase, available_titles.keys(),
@@ -132,36 +187,32 @@ class ObsidianLinker:
                             'sentence': sentence.strip()
                         })
 
-        # Sort by score and remove duplicates
+        # Sort by score and keep the best link per phrase (dicts keep insertion order)
         potential_links.sort(key=lambda x: x['score'], reverse=True)
-        seen_phrases = set()
-        unique_links = []
-
+        best_by_phrase = {}
         for link in potential_links:
-            if link['phrase'] not in seen_phrases:
-                unique_links.append(link)
-                seen_phrases.add(link['phrase'])
+            best_by_phrase.setdefault(link['phrase'], link)
 
-        return unique_links[:10]  # Limit to top 10 links to avoid over-linking
+        return list(best_by_phrase.values())[:10]  # Limit to top 10 links to avoid over-linking
 
     def _extract_phrases(self, sentence):
         """Extract potential linkable phrases from a sentence."""
         phrases = []
 
         # Look for multi-word capitalized phrases (proper nouns, technical terms)
-        capitalized_phrases = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', sentence)
+        capitalized_phrases = _CAPITALIZED_PHRASE_PATTERN.findall(sentence)
         phrases.extend([p for p in capitalized_phrases if len(p) > 3])
 
         # Look for technical terms and concepts (words with specific patterns)
-        technical_terms = re.findall(r'\b[a-z]+(?:[A-Z][a-z]*)+\b', sentence)  # camelCase terms
+        technical_terms = _CAMEL_CASE_PATTERN.findall(sentence)  # camelCase terms
         phrases.extend(technical_terms)
 
         # Look for quoted terms
-        quoted_terms = re.findall(r'"([^"]+)"', sentence)
+        quoted_terms = _QUOTED_PATTERN.findall(sentence)
         phrases.extend([q for q in quoted_terms if len(q) > 3])
 
         # Look for terms in parentheses
-        parenthetical = re.findall(r'\(([^)]+)\)', sentence)
+        parenthetical = _PARENTHETICAL_PATTERN.findall(sentence)
         phrases.extend([p for p in parenthetical if len(p) > 3 and not p.isdigit()])
 
         return list(set(phrases))  # Remove duplicates
@@ -194,6 +245,10 @@ class ObsidianLinker:
         if not self.note_titles:
             self.build_note_index()
 
+        # Nothing to link to - skip phrase extraction
+        if not self.note_titles:
+            return content
+
         # Find potential links
         potential_links = self.find_potential_links(content, exclude_current_title=current_title)
 
@@ -217,24 +272,35 @@ class ObsidianLinker:
             pattern = r'\b' + re.escape(phrase) + r'\b(?![^\[]*\]\])'
 
             # Replace the first occurrence only to avoid over-linking
-            if re.search(pattern, modified_content):
-                modified_content = re.sub(pattern, obsidian_link, modified_content, count=1)
+            # (single scan; callable replacement so titles aren't parsed as escapes)
+            modified_content, replaced = re.subn(
+                pattern, lambda _: obsidian_link, modified_content, count=1
+            )
+            if replaced:
                 logger.info(f"    Linked: '{phrase}' -> [[{title}]]{subject_info}")
 
         return modified_content
 
+    def process_content(self, content, file_path=None):
+        """
+        Add Obsidian links to markdown that hasn't been written yet.
+
+        Lets the pipeline link notes in memory and write the file once,
+        instead of writing, reading back and rewriting it.
+        """
+        # Extract current note title
+        title_match = _TITLE_PATTERN.search(content)
+        current_title = title_match.group(1).strip() if title_match else None
+
+        return self.apply_links(content, file_path, current_title)
+
     def process_file(self, file_path):
         """Process a single file to add Obsidian links."""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
 
-            # Extract current note title
-            title_match = re.search(r'^# (.+)$', content, re.MULTILINE)
-            current_title = title_match.group(1).strip() if title_match else None
-
-            # Apply links
-            modified_content = self.apply_links(content, file_path, current_title)
+            modified_content = self.process_content(content, file_path)
 
             # Only write back if content was modified
             if modified_content != content:
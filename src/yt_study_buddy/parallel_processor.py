@@ -10,7 +10,7 @@ from dataclasses import dataclass
 from loguru import logger
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     """Result from processing a single video."""
     url: str
@@ -104,7 +104,7 @@ class ParallelVideoProcessor:
         logger.info(f"{'='*50}\n")
 
         results = []
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Create single worker instance if factory provided
         worker_instance = worker_factory() if worker_factory else None
@@ -155,7 +155,7 @@ class ParallelVideoProcessor:
                 logger.error(f"    ✗ Unexpected error: {e}")
 
         # Summary
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
         success_count = sum(1 for r in results if r.success)
 
         logger.info(f"\n{'='*50}")
@@ -197,7 +197,7 @@ class ParallelVideoProcessor:
 
         results = []
         completed_count = 0
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Create wrapper function that creates per-worker instance if needed
         def worker_wrapper(url_and_id: tuple) -> ProcessingResult:
@@ -261,7 +261,7 @@ class ParallelVideoProcessor:
                     logger.error(f"    Unexpected error: {e}")
 
         # Summary
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
         success_count = sum(1 for r in results if r.success)
 
         logger.info(f"\n{'='*50}")
@@ -299,21 +299,31 @@ class ProcessingMetrics:
         self.total_time += result.duration_seconds
 
     def print_summary(self):
-        """Print metrics summary."""
-        logger.info(f"\n{'='*50}")
+        """
+        Print metrics summary.
+
+        Every line keeps its own log level; only consecutive lines at the
+        same level are batched into one record.
+        """
+        rule = '=' * 50
+        success_rate = self.successful / self.total_videos * 100 if self.total_videos else 0.0
+        logger.info(f"\n{rule}")
         logger.debug("PROCESSING METRICS")
-        logger.info(f"{'='*50}")
-        logger.info(f"Total videos processed: {self.total_videos}")
-        logger.success(f"Success rate: {self.successful}/{self.total_videos} ({self.successful/self.total_videos*100:.1f}%)")
+        logger.info(f"{rule}\nTotal videos processed: {self.total_videos}")
+        logger.success(f"Success rate: {self.successful}/{self.total_videos} ({success_rate:.1f}%)")
         logger.error(f"Failed: {self.failed}")
 
         if self.method_counts:
-            logger.info(f"\nMethods used:")
-            for method, count in self.method_counts.items():
-                if count > 0:
-                    logger.success(f"  {method}: {count} ({count/self.successful*100:.1f}%)")
+            logger.info("\nMethods used:")
+            method_lines = [
+                f"  {method}: {count} ({count/self.successful*100:.1f}%)"
+                for method, count in self.method_counts.items()
+                if count > 0
+            ]
+            if method_lines:
+                logger.success('\n'.join(method_lines))
 
         if self.total_videos > 0:
             logger.debug(f"\nAverage processing time: {self.total_time/self.total_videos:.1f}s per video")
 
-        logger.info(f"{'='*50}\n")
+        logger.info(f"{rule}\n")
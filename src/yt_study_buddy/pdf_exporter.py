@@ -3,8 +3,11 @@ PDF exporter for markdown study notes with Obsidian-style themes.
 
 Converts markdown notes to beautiful PDFs using markdown2 and WeasyPrint.
 """
+import hashlib
 import os
 import re
+import shutil
+import threading
 from pathlib import Path
 from typing import Optional, List
 
@@ -13,10 +16,15 @@ from loguru import logger
 try:
     import markdown2
     from weasyprint import HTML, CSS
+    from weasyprint.text.fonts import FontConfiguration
     WEASYPRINT_AVAILABLE = True
 except ImportError:
     WEASYPRINT_AVAILABLE = False
 
+# Obsidian syntax rewritten before markdown conversion, compiled once
+_WIKI_LINK_PATTERN = re.compile(r'\[\[([^\]]+)\]\]')
+_YOUTUBE_LINK_PATTERN = re.compile(r'\[YouTube Video\]\((https://[^\)]+)\)')
+
 
 class PDFExporter:
     """Export markdown files to PDF with custom themes."""
@@ -29,12 +37,19 @@ class PDFExporter:
         'minimal': 'minimal'
     }
 
-    def __init__(self, theme: str = 'obsidian'):
+    # Default location for rendered PDFs, keyed by content hash
+    DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'yt_study_buddy' / 'pdfs'
+
+    def __init__(self, theme: str = 'obsidian', cache_dir: Optional[Path] = None,
+                 use_cache: bool = True):
         """
         Initialize PDF exporter.
 
         Args:
             theme: Theme name ('default', 'obsidian', 'academic', 'minimal')
+            cache_dir: Root directory for the rendered-PDF cache
+                      (default: ~/.cache/yt_study_buddy/pdfs)
+            use_cache: Reuse previously rendered PDFs for identical markdown (default: True)
         """
         if not WEASYPRINT_AVAILABLE:
             raise ImportError(
@@ -44,6 +59,48 @@ class PDFExporter:
 
         self.theme = theme if theme in self.THEMES else 'obsidian'
         self.theme_dir = Path(__file__).parent / 'themes'
+        self.use_cache = use_cache
+        self.cache_dir = Path(cache_dir) if cache_dir else self.DEFAULT_CACHE_DIR
+
+        # Parsing the theme CSS and loading fonts is most of the cost of
+        # rendering a short note, so each worker thread builds them once.
+        # A FontConfiguration wraps a Pango font map, which is not safe to
+        # share between concurrent write_pdf calls.
+        self._thread_styles = threading.local()
+        self._markdown = markdown2.Markdown(
+            extras=['fenced-code-blocks', 'tables', 'strike', 'task_list']
+        )
+        self._render_lock = threading.Lock()
+
+    def _get_cache_path(self, full_html: str) -> Path:
+        """
+        Get cache location for a rendered PDF.
+
+        The key covers everything that ends up in the PDF: the HTML document
+        (which includes the title) and the theme.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(full_html.encode('utf-8'))
+        digest.update(b'\0' + self.theme.encode('utf-8'))
+        return self.cache_dir / self.theme / f"{digest.hexdigest()}.pdf"
+
+    @staticmethod
+    def _link_or_copy(source: Path, target: Path):
+        """Hardlink source to target, falling back to a copy across filesystems."""
+        if target.exists() or target.is_symlink():
+            target.unlink()
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copyfile(source, target)
+
+    def _get_stylesheet(self):
+        """Get this thread's parsed theme stylesheet and font configuration."""
+        styles = self._thread_styles
+        if not hasattr(styles, 'stylesheet'):
+            styles.font_config = FontConfiguration()
+            styles.stylesheet = CSS(string=self._get_theme_css(), font_config=styles.font_config)
+        return styles.stylesheet, styles.font_config
 
     def _get_theme_css(self) -> str:
         """Get CSS for the selected theme."""
@@ -303,17 +360,103 @@ class PDFExporter:
                 return f'<span class="wiki-link">{alias.strip()}</span>'
             return f'<span class="wiki-link">{link_text}</span>'
 
-        markdown_content = re.sub(r'\[\[([^\]]+)\]\]', replace_wiki_link, markdown_content)
+        # Substring checks are far cheaper than a regex scan that finds nothing
+        if '[[' in markdown_content:
+            markdown_content = _WIKI_LINK_PATTERN.sub(replace_wiki_link, markdown_content)
 
         # Handle YouTube links specially
-        markdown_content = re.sub(
-            r'\[YouTube Video\]\((https://[^\)]+)\)',
-            r'<a href="\1" class="youtube-link">🎥 Watch on YouTube</a>',
-            markdown_content
-        )
+        if '[YouTube Video]' in markdown_content:
+            markdown_content = _YOUTUBE_LINK_PATTERN.sub(
+                r'<a href="\1" class="youtube-link">🎥 Watch on YouTube</a>',
+                markdown_content
+            )
 
         return markdown_content
 
+    def render_html(self, markdown_content: str, title: str) -> str:
+        """
+        Convert note markdown to the full HTML document used for the PDF.
+
+        Args:
+            markdown_content: Raw markdown content (Obsidian syntax allowed)
+            title: Document title
+
+        Returns:
+            Complete HTML document
+        """
+        # Preprocess markdown
+        markdown_content = self._preprocess_markdown(markdown_content)
+
+        # Convert to HTML (the shared converter is stateful, so one at a time)
+        with self._render_lock:
+            html_content = self._markdown.convert(markdown_content)
+
+        # Wrap in HTML document
+        return f"""
+            <!DOCTYPE html>
+            <html>
+            <head>
+                <meta charset="UTF-8">
+                <title>{title}</title>
+            </head>
+            <body>
+                {html_content}
+            </body>
+            </html>
+            """
+
+    def html_to_pdf(
+        self,
+        full_html: str,
+        output_file: Path,
+        base_url: Optional[Path] = None
+    ) -> Path:
+        """
+        Render an HTML document (from render_html) to PDF.
+
+        Args:
+            full_html: Complete HTML document
+            output_file: Output PDF path
+            base_url: Directory for resolving relative links and images
+
+        Returns:
+            Path to generated PDF file
+        """
+        output_file = Path(output_file)
+
+        # Reuse a previous render of identical content if available
+        cache_path = None
+        if self.use_cache:
+            cache_path = self._get_cache_path(full_html)
+            if cache_path.exists():
+                try:
+                    self._link_or_copy(cache_path, output_file)
+                    logger.success(f"✓ PDF reused from cache: {output_file}")
+                    return output_file
+                except OSError as e:
+                    logger.warning(f"PDF cache reuse failed, rendering instead: {e}")
+
+        # Generate PDF
+        html = HTML(string=full_html, base_url=str(base_url) if base_url else None)
+        css, font_config = self._get_stylesheet()
+
+        # Output may be a hardlink into the cache - never overwrite in place
+        if output_file.exists():
+            output_file.unlink()
+        html.write_pdf(output_file, stylesheets=[css], font_config=font_config)
+
+        logger.success(f"✓ PDF generated: {output_file}")
+
+        # Store render in cache (non-critical)
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                self._link_or_copy(output_file, cache_path)
+            except OSError as e:
+                logger.warning(f"Could not store PDF in cache: {e}")
+
+        return output_file
+
     def markdown_to_pdf(
         self,
         markdown_file: Path,
@@ -340,42 +483,14 @@ class PDFExporter:
         with open(markdown_file, 'r', encoding='utf-8') as f:
             markdown_content = f.read()
 
-        # Preprocess markdown
-        markdown_content = self._preprocess_markdown(markdown_content)
-
-        # Convert to HTML
-        html_content = markdown2.markdown(
-            markdown_content,
-            extras=['fenced-code-blocks', 'tables', 'strike', 'task_list']
-        )
-
-        # Wrap in HTML document
-        full_html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <title>{markdown_file.stem}</title>
-        </head>
-        <body>
-            {html_content}
-        </body>
-        </html>
-        """
-
         # Determine output path
         if output_file is None:
             output_file = markdown_file.with_suffix('.pdf')
         else:
             output_file = Path(output_file)
 
-        # Generate PDF
-        html = HTML(string=full_html, base_url=str(markdown_file.parent))
-        css = CSS(string=self._get_theme_css())
-
-        html.write_pdf(output_file, stylesheets=[css])
-
-        logger.success(f"✓ PDF generated: {output_file}")
+        full_html = self.render_html(markdown_content, markdown_file.stem)
+        self.html_to_pdf(full_html, output_file, base_url=markdown_file.parent)
 
         # Open PDF if requested
         if open_after:
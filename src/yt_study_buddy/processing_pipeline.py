@@ -3,14 +3,22 @@ Stateless processing pipeline for video jobs.
 
 Each function takes a VideoProcessingJob and returns it (modified).
 Functions are idempotent and resumable - they check if work is already done.
+
+Log calls pass values as loguru format arguments rather than f-strings, so
+messages below the active log level are never formatted.
 """
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from loguru import logger
 
-from .video_job import VideoProcessingJob, ProcessingStage
+from .artifact_writer import write_atomic
+from .study_notes_generator import StudyNotesGenerator
+from .video_job import OutputPaths, VideoProcessingJob, ProcessingStage
 
 
 # ============================================================================
@@ -38,52 +46,54 @@ def fetch_transcript_and_title(
     """
     # Check if already done
     if job.has_transcript():
-        logger.warning(f"  [Job {job.video_id}] Transcript already fetched, skipping")
+        logger.warning("  [Job {}] Transcript already fetched, skipping", job.video_id)
         return job
 
-    stage_start = time.time()
     job.set_stage(ProcessingStage.FETCHING_TRANSCRIPT)
 
     try:
-        # Fetch transcript
-        logger.info(f"  [Job {job.video_id}] Fetching transcript...")
-        transcript_data = video_processor.get_transcript(job.video_id)
-
-        if not transcript_data:
-            raise ValueError("Could not get transcript: Both Tor and yt-dlp fallback failed")
-
-        job.transcript = transcript_data['transcript']
-        job.transcript_data = transcript_data
-
-        if transcript_data.get('duration'):
-            logger.info(f"    Duration: {transcript_data['duration']}")
-        logger.info(f"    Length: {transcript_data['length']} characters")
-
-        # Fetch title (non-critical - use video ID as fallback)
-        logger.info(f"  [Job {job.video_id}] Fetching title...")
-        title_fetched = False
-        try:
-            job.video_title = video_processor.get_video_title(
-                job.video_id,
-                worker_id=worker_id
-            )
-            if job.video_title and not job.video_title.startswith("Video_"):
-                logger.info(f"    Title: {job.video_title}")
-                title_fetched = True
-            else:
-                logger.warning(f"    ⚠️  Got fallback title, will use video ID")
+        with job.timed_stage('fetch_transcript'):
+            # Fetch transcript
+            logger.info("  [Job {}] Fetching transcript...", job.video_id)
+            transcript_data = video_processor.get_transcript(job.video_id)
+
+            if not transcript_data:
+                raise ValueError("Could not get transcript: Both Tor and yt-dlp fallback failed")
+
+            job.transcript = transcript_data['transcript']
+            job.transcript_data = transcript_data
+
+            if transcript_data.get('duration'):
+                logger.info("    Duration: {}", transcript_data['duration'])
+            logger.info("    Length: {} characters", transcript_data['length'])
+
+            # Fetch title after the transcript, not alongside it: both go
+            # through Tor, and a second concurrent request per job would
+            # work against the rate limit and exit node cooldowns.
+            # Title is non-critical - use video ID as fallback
+            logger.info("  [Job {}] Fetching title...", job.video_id)
+            title_fetched = False
+            try:
+                job.video_title = video_processor.get_video_title(
+                    job.video_id,
+                    worker_id=worker_id
+                )
+                if job.video_title and not job.video_title.startswith("Video_"):
+                    logger.info("    Title: {}", job.video_title)
+                    title_fetched = True
+                else:
+                    logger.warning("    ⚠️  Got fallback title, will use video ID")
+                    job.video_title = f"Video_{job.video_id}"
+            except Exception as title_error:
+                # Title fetch failed - use video ID as fallback
+                logger.warning("    ⚠️  Title fetch failed: {}", title_error)
+                logger.info("    Using video ID as fallback title")
                 job.video_title = f"Video_{job.video_id}"
-        except Exception as title_error:
-            # Title fetch failed - use video ID as fallback
-            logger.warning(f"    ⚠️  Title fetch failed: {title_error}")
-            logger.info(f"    Using video ID as fallback title")
-            job.video_title = f"Video_{job.video_id}"
 
-        # Mark that we need AI title generation later
-        job.needs_ai_title = not title_fetched
+            # Mark that we need AI title generation later
+            job.needs_ai_title = not title_fetched
 
-        job.set_stage(ProcessingStage.TRANSCRIPT_FETCHED)
-        job.add_timing('fetch_transcript', time.time() - stage_start)
+            job.set_stage(ProcessingStage.TRANSCRIPT_FETCHED)
 
         return job
 
@@ -98,7 +108,8 @@ def fetch_transcript_and_title(
 
 def generate_study_notes(
     job: VideoProcessingJob,
-    notes_generator
+    notes_generator,
+    claude_semaphore: Optional[threading.Semaphore] = None
 ) -> VideoProcessingJob:
     """
     Generate study notes using Claude AI.
@@ -109,49 +120,37 @@ def generate_study_notes(
     Args:
         job: VideoProcessingJob to process
         notes_generator: StudyNotesGenerator instance
+        claude_semaphore: Optional semaphore bounding concurrent Claude calls
 
     Returns:
         Same job object with study_notes populated
     """
     # Check if already done
     if job.has_notes():
-        logger.warning(f"  [Job {job.video_id}] Notes already generated, skipping")
+        logger.warning("  [Job {}] Notes already generated, skipping", job.video_id)
         return job
 
     if not job.has_transcript():
         raise ValueError("Cannot generate notes without transcript")
 
-    stage_start = time.time()
     job.set_stage(ProcessingStage.GENERATING_NOTES)
 
     try:
-        logger.info(f"  [Job {job.video_id}] Generating study notes...")
+        with job.timed_stage('generate_notes'):
+            logger.info("  [Job {}] Generating study notes...", job.video_id)
 
-        # Request title suggestion in the same call if needed (no extra LLM call)
-        job.study_notes = notes_generator.generate_notes(
-            transcript=job.transcript,
-            suggest_title=job.needs_ai_title
-        )
+            # Request title suggestion in the same call if needed (no extra LLM call)
+            with claude_semaphore or nullcontext():
+                job.study_notes = notes_generator.generate_notes(
+                    transcript=job.transcript,
+                    suggest_title=job.needs_ai_title
+                )
 
-        # Extract title from notes if it was requested
-        if job.needs_ai_title:
-            from .study_notes_generator import StudyNotesGenerator
-            extracted_title, cleaned_notes = StudyNotesGenerator.extract_title_from_notes(job.study_notes)
-
-            if extracted_title:
-                old_title = job.video_title
-                job.video_title = extracted_title
-                job.study_notes = cleaned_notes  # Use notes without the title line
-                job.needs_ai_title = False  # Mark as resolved
-                logger.success(f"    ✓ AI-generated title: {extracted_title}")
-                logger.debug(f"    (Replaced fallback: {old_title})")
-            else:
-                logger.warning(f"    ⚠️  Could not extract title from notes, keeping: {job.video_title}")
+            _apply_ai_title(job)
 
-        job.set_stage(ProcessingStage.NOTES_GENERATED)
-        job.add_timing('generate_notes', time.time() - stage_start)
+            job.set_stage(ProcessingStage.NOTES_GENERATED)
 
-        logger.success(f"    ✓ Notes generated ({len(job.study_notes)} chars)")
+        logger.success("    ✓ Notes generated ({} chars)", len(job.study_notes))
         return job
 
     except Exception as e:
@@ -159,9 +158,28 @@ def generate_study_notes(
         raise
 
 
+def _apply_ai_title(job: VideoProcessingJob):
+    """Extract the AI-suggested title from job.study_notes if one was requested."""
+    if not job.needs_ai_title:
+        return
+
+    extracted_title, cleaned_notes = StudyNotesGenerator.extract_title_from_notes(job.study_notes)
+
+    if extracted_title:
+        old_title = job.video_title
+        job.video_title = extracted_title
+        job.study_notes = cleaned_notes  # Use notes without the title line
+        job.needs_ai_title = False  # Mark as resolved
+        logger.success("    ✓ AI-generated title: {}", extracted_title)
+        logger.debug("    (Replaced fallback: {})", old_title)
+    else:
+        logger.warning("    ⚠️  Could not extract title from notes, keeping: {}", job.video_title)
+
+
 def generate_assessment(
     job: VideoProcessingJob,
-    assessment_generator
+    assessment_generator,
+    claude_semaphore: Optional[threading.Semaphore] = None
 ) -> VideoProcessingJob:
     """
     Generate learning assessment using Claude AI.
@@ -169,47 +187,52 @@ def generate_assessment(
     Stateless: Only calls AI API and populates job.assessment_content.
     Resumable: Skips if assessment already generated.
 
+    Progress is recorded in job.assessment_stage rather than job.stage, so
+    this can run in another thread while the notes stages advance job.stage.
+
     Args:
         job: VideoProcessingJob to process
         assessment_generator: AssessmentGenerator instance
+        claude_semaphore: Optional semaphore bounding concurrent Claude calls
 
     Returns:
         Same job object with assessment_content populated
     """
     # Check if already done
     if job.has_assessment():
-        logger.warning(f"  [Job {job.video_id}] Assessment already generated, skipping")
+        logger.warning("  [Job {}] Assessment already generated, skipping", job.video_id)
         return job
 
     if not job.has_notes():
         raise ValueError("Cannot generate assessment without notes")
 
     if not assessment_generator:
-        logger.warning(f"  [Job {job.video_id}] Assessment generation disabled, skipping")
+        logger.warning("  [Job {}] Assessment generation disabled, skipping", job.video_id)
         return job
 
-    stage_start = time.time()
-    job.set_stage(ProcessingStage.GENERATING_ASSESSMENT)
+    job.assessment_stage = ProcessingStage.GENERATING_ASSESSMENT
 
     try:
-        logger.info(f"  [Job {job.video_id}] Generating assessment...")
-        job.assessment_content = assessment_generator.generate_assessment(
-            job.transcript,
-            job.study_notes,
-            job.video_title,
-            job.get_youtube_url()
-        )
-
-        job.set_stage(ProcessingStage.ASSESSMENT_GENERATED)
-        job.add_timing('generate_assessment', time.time() - stage_start)
-
-        logger.success(f"    ✓ Assessment generated ({len(job.assessment_content)} chars)")
+        with job.timed_stage('generate_assessment'):
+            logger.info("  [Job {}] Generating assessment...", job.video_id)
+            with claude_semaphore or nullcontext():
+                job.assessment_content = assessment_generator.generate_assessment(
+                    job.transcript,
+                    job.study_notes,
+                    job.video_title,
+                    job.get_youtube_url()
+                )
+
+            job.assessment_stage = ProcessingStage.ASSESSMENT_GENERATED
+
+        logger.success("    ✓ Assessment generated ({} chars)", len(job.assessment_content))
         return job
 
     except Exception as e:
         # Assessment failure is not critical, just log and continue
-        logger.error(f"    ✗ Assessment generation failed: {e}")
+        logger.error("    ✗ Assessment generation failed: {}", e)
         job.assessment_content = None
+        job.assessment_stage = ProcessingStage.FAILED
         return job
 
 
@@ -217,10 +240,26 @@ def generate_assessment(
 # Stage 3: Write Files
 # ============================================================================
 
+def plan_output_paths(output_dir: Path, sanitized_title: str) -> OutputPaths:
+    """
+    Build every output path for a job in one place.
+
+    Computed once when files are first written and kept on job.output_paths,
+    so the write, late-assessment and PDF stages reuse the same objects.
+    """
+    pdf_dir = output_dir / "pdfs"
+    return OutputPaths(
+        notes_file=output_dir / f"{sanitized_title}.md",
+        assessment_file=output_dir / f"Assessment_{sanitized_title}.md",
+        pdf_dir=pdf_dir,
+        notes_pdf=pdf_dir / f"{sanitized_title}.pdf"
+    )
+
 def write_markdown_files(
     job: VideoProcessingJob,
     output_dir: Path,
-    filename_sanitizer
+    filename_sanitizer,
+    obsidian_linker=None
 ) -> VideoProcessingJob:
     """
     Write markdown files to disk.
@@ -228,51 +267,57 @@ def write_markdown_files(
     Stateless: Only writes files and populates job file paths.
     Resumable: Skips if files already exist.
 
+    When obsidian_linker is given, cross-reference links are added to the
+    notes in memory so the file is written once (no write/read/rewrite).
+    PDF export renders from job.notes_markdown when the linker is used and
+    reads the file back otherwise. The assessment is written separately by
+    write_assessment_file.
+
     Args:
         job: VideoProcessingJob to process
         output_dir: Base output directory
         filename_sanitizer: Function to sanitize filenames
+        obsidian_linker: Optional ObsidianLinker to apply before writing
 
     Returns:
         Same job object with file paths populated
     """
     # Check if already done
     if job.has_files_written():
-        logger.warning(f"  [Job {job.video_id}] Files already written, skipping")
+        logger.warning("  [Job {}] Files already written, skipping", job.video_id)
         return job
 
     if not job.has_notes():
         raise ValueError("Cannot write files without notes")
 
-    stage_start = time.time()
     job.set_stage(ProcessingStage.WRITING_FILES)
 
     try:
-        # Ensure output directory exists
-        output_dir.mkdir(parents=True, exist_ok=True)
-        job.output_dir = output_dir
-
-        # Write study notes file
-        sanitized_title = filename_sanitizer(job.video_title)
-        job.notes_filepath = output_dir / f"{sanitized_title}.md"
-
-        markdown_content = job.get_markdown_content()
-        job.notes_filepath.write_text(markdown_content, encoding='utf-8')
-
-        logger.success(f"  [Job {job.video_id}] ✓ Notes saved: {job.notes_filepath.name}")
-
-        # Write assessment file if exists
-        if job.assessment_content:
-            assessment_filename = f"Assessment_{sanitized_title}.md"
-            job.assessment_filepath = output_dir / assessment_filename
-            job.assessment_filepath.write_text(
-                job.assessment_content,
-                encoding='utf-8'
+        with job.timed_stage('write_files'):
+            # Ensure output directory exists
+            output_dir.mkdir(parents=True, exist_ok=True)
+            job.output_dir = output_dir
+            job.output_paths = plan_output_paths(
+                output_dir, filename_sanitizer(job.video_title)
             )
-            logger.success(f"  [Job {job.video_id}] ✓ Assessment saved: {job.assessment_filepath.name}")
 
-        job.set_stage(ProcessingStage.FILES_WRITTEN)
-        job.add_timing('write_files', time.time() - stage_start)
+            # Write study notes file
+            job.notes_filepath = job.output_paths.notes_file
+
+            if obsidian_linker:
+                # Keep the linked markdown so PDF export needn't read the file back
+                job.notes_markdown = _link_markdown(job, obsidian_linker)
+                markdown_content = job.notes_markdown
+            else:
+                markdown_content = job.get_markdown_content()
+
+            # Atomic so a crash never leaves a half-written notes file that
+            # has_files_written() would accept on retry
+            write_atomic(job.notes_filepath, markdown_content)
+
+            logger.success("  [Job {}] ✓ Notes saved: {}", job.video_id, job.notes_filepath.name)
+
+            job.set_stage(ProcessingStage.FILES_WRITTEN)
 
         return job
 
@@ -281,12 +326,75 @@ def write_markdown_files(
         raise
 
 
+def _link_markdown(job: VideoProcessingJob, obsidian_linker) -> str:
+    """Return the notes markdown with Obsidian links added (unlinked on failure)."""
+    markdown_content = job.get_markdown_content()
+
+    try:
+        logger.info("  [Job {}] Adding cross-references...", job.video_id)
+        markdown_content = obsidian_linker.process_content(
+            markdown_content, job.notes_filepath
+        )
+        logger.success("    ✓ Links processed")
+    except Exception as e:
+        # Link processing failure is not critical
+        logger.error("    ✗ Link processing failed: {}", e)
+
+    return markdown_content
+
+
+def _write_assessment(job: VideoProcessingJob):
+    """Write the assessment markdown next to the notes file."""
+    job.assessment_filepath = job.output_paths.assessment_file
+    write_atomic(job.assessment_filepath, job.assessment_content)
+    logger.success("  [Job {}] ✓ Assessment saved: {}", job.video_id, job.assessment_filepath.name)
+
+
+def write_assessment_file(
+    job: VideoProcessingJob,
+    filename_sanitizer
+) -> VideoProcessingJob:
+    """
+    Write the assessment file for a job whose notes are already on disk.
+
+    Runs after write_markdown_files, once the assessment has finished.
+    Resumable: Skips if there is no assessment or it was already written.
+
+    Args:
+        job: VideoProcessingJob to process
+        filename_sanitizer: Function to sanitize filenames
+
+    Returns:
+        Same job object with assessment_filepath populated
+    """
+    if not job.assessment_content or job.assessment_filepath is not None:
+        return job
+
+    if not job.has_files_written():
+        raise ValueError("Cannot write assessment before notes file")
+
+    try:
+        if job.output_paths is None:
+            job.output_paths = plan_output_paths(
+                job.output_dir, filename_sanitizer(job.video_title)
+            )
+        _write_assessment(job)
+    except Exception as e:
+        # Assessment is not critical, notes are already saved
+        logger.error("  [Job {}] ✗ Assessment write failed: {}", job.video_id, e)
+
+    return job
+
+
 def process_obsidian_links(
     job: VideoProcessingJob,
     obsidian_linker
 ) -> VideoProcessingJob:
     """
-    Add Obsidian cross-reference links to markdown files.
+    Add Obsidian cross-reference links to markdown files already on disk.
+
+    The pipeline links notes in write_markdown_files; this stage is kept
+    for re-processing existing notes (e.g., after the vault has grown).
 
     Stateless: Only modifies files on disk.
     Resumable: Can be re-run safely (idempotent).
@@ -299,18 +407,18 @@ def process_obsidian_links(
         Same job object (unchanged)
     """
     if not job.has_files_written():
-        logger.warning(f"  [Job {job.video_id}] Files not written yet, skipping link processing")
+        logger.warning("  [Job {}] Files not written yet, skipping link processing", job.video_id)
         return job
 
     try:
-        logger.info(f"  [Job {job.video_id}] Adding cross-references...")
+        logger.info("  [Job {}] Adding cross-references...", job.video_id)
         obsidian_linker.process_file(job.notes_filepath)
-        logger.success(f"    ✓ Links processed")
+        logger.success("    ✓ Links processed")
         return job
 
     except Exception as e:
         # Link processing failure is not critical
-        logger.error(f"    ✗ Link processing failed: {e}")
+        logger.error("    ✗ Link processing failed: {}", e)
         return job
 
 
@@ -336,55 +444,69 @@ def export_pdfs(
         Same job object with PDF paths populated
     """
     if not pdf_exporter:
-        logger.warning(f"  [Job {job.video_id}] PDF export disabled, skipping")
+        logger.warning("  [Job {}] PDF export disabled, skipping", job.video_id)
         return job
 
     # Check if already done
     if job.has_pdfs_exported():
-        logger.warning(f"  [Job {job.video_id}] PDFs already exported, skipping")
+        logger.warning("  [Job {}] PDFs already exported, skipping", job.video_id)
         return job
 
     if not job.has_files_written():
         raise ValueError("Cannot export PDFs without markdown files")
 
-    stage_start = time.time()
     job.set_stage(ProcessingStage.EXPORTING_PDFS)
 
     try:
-        # Create pdfs/ subdirectory
-        job.pdf_subdir = job.output_dir / "pdfs"
-        job.pdf_subdir.mkdir(exist_ok=True)
-
-        # Export notes PDF
-        if job.notes_filepath and job.notes_filepath.exists():
-            pdf_filename = job.notes_filepath.stem + ".pdf"
-            job.notes_pdf_path = job.pdf_subdir / pdf_filename
-
-            pdf_exporter.markdown_to_pdf(
-                job.notes_filepath,
-                job.notes_pdf_path
-            )
-            logger.success(f"  [Job {job.video_id}] ✓ Notes PDF: {job.notes_pdf_path.name}")
-
-        # Assessment PDFs disabled - only export notes
-        # if job.assessment_filepath and job.assessment_filepath.exists():
-        #     pdf_filename = job.assessment_filepath.stem + ".pdf"
-        #     job.assessment_pdf_path = job.pdf_subdir / pdf_filename
-        #
-        #     pdf_exporter.markdown_to_pdf(
-        #         job.assessment_filepath,
-        #         job.assessment_pdf_path
-        #     )
-        #     logger.success(f"  [Job {job.video_id}] ✓ Assessment PDF: {job.assessment_pdf_path.name}")
-
-        job.set_stage(ProcessingStage.COMPLETED)
-        job.add_timing('export_pdfs', time.time() - stage_start)
+        with job.timed_stage('export_pdfs'):
+            # Jobs resumed from disk have no planned paths yet
+            if job.output_paths is None:
+                job.output_paths = plan_output_paths(
+                    job.output_dir, job.notes_filepath.stem
+                )
+
+            # Create pdfs/ subdirectory
+            job.pdf_subdir = job.output_paths.pdf_dir
+            job.pdf_subdir.mkdir(exist_ok=True)
+
+            # Export notes PDF
+            if job.notes_filepath and job.notes_filepath.exists():
+                job.notes_pdf_path = job.output_paths.notes_pdf
+
+                if job.notes_markdown is not None:
+                    # Render straight from the markdown the write stage produced
+                    full_html = pdf_exporter.render_html(
+                        job.notes_markdown, job.notes_filepath.stem
+                    )
+                    pdf_exporter.html_to_pdf(
+                        full_html, job.notes_pdf_path, base_url=job.output_dir
+                    )
+                    job.notes_markdown = None
+                else:
+                    pdf_exporter.markdown_to_pdf(
+                        job.notes_filepath,
+                        job.notes_pdf_path
+                    )
+                logger.success("  [Job {}] ✓ Notes PDF: {}", job.video_id, job.notes_pdf_path.name)
+
+            # Assessment PDFs disabled - only export notes
+            # if job.assessment_filepath and job.assessment_filepath.exists():
+            #     pdf_filename = job.assessment_filepath.stem + ".pdf"
+            #     job.assessment_pdf_path = job.pdf_subdir / pdf_filename
+            #
+            #     pdf_exporter.markdown_to_pdf(
+            #         job.assessment_filepath,
+            #         job.assessment_pdf_path
+            #     )
+            #     logger.success(f"  [Job {job.video_id}] ✓ Assessment PDF: {job.assessment_pdf_path.name}")
+
+            job.set_stage(ProcessingStage.COMPLETED)
 
         return job
 
     except Exception as e:
         # PDF export failure is not critical
-        logger.error(f"  [Job {job.video_id}] ✗ PDF export failed: {e}")
+        logger.error("  [Job {}] ✗ PDF export failed: {}", job.video_id, e)
         return job
 
 
@@ -392,6 +514,55 @@ def export_pdfs(
 # Complete Pipeline
 # ============================================================================
 
+# Header/footer line around each job's log output
+JOB_SEPARATOR = '=' * 60
+
+# Claude calls allowed in flight across all workers (see 'claude_semaphore')
+DEFAULT_CLAUDE_CONCURRENCY = 3
+
+
+def _begin_job(job: VideoProcessingJob) -> float:
+    """
+    Record start time and log the job header.
+
+    Returns a perf_counter() reading for the duration; job.start_time keeps
+    the wall-clock timestamp for the job log.
+    """
+    job.start_time = time.time()
+    start_time = time.perf_counter()
+
+    logger.info("\n{}", JOB_SEPARATOR)
+    logger.debug("Processing Job: {}", job.video_id)
+    logger.info(JOB_SEPARATOR)
+
+    return start_time
+
+
+def _finish_job(
+    job: VideoProcessingJob,
+    components: dict,
+    start_time: float,
+    error: Optional[Exception] = None
+) -> VideoProcessingJob:
+    """Mark the job completed or failed, and log it."""
+    job.end_time = time.time()
+    job.processing_duration = time.perf_counter() - start_time
+
+    if error is None:
+        job.mark_completed(job.processing_duration)
+        logger.success("  ✓ Job completed in {:.1f}s", job.processing_duration)
+    else:
+        job.mark_failed(str(error))
+        logger.error("  ✗ Job failed: {}", error)
+    logger.info("{}\n", JOB_SEPARATOR)
+
+    # Log job if logger provided
+    if components.get('job_logger'):
+        components['job_logger'].log_job(job)
+
+    return job
+
+
 def process_video_job(
     job: VideoProcessingJob,
     components: dict
@@ -410,20 +581,16 @@ def process_video_job(
             - 'obsidian_linker': ObsidianLinker instance
             - 'pdf_exporter': PDFExporter instance (optional)
             - 'job_logger': JobLogger instance (optional)
+            - 'claude_semaphore': Semaphore bounding Claude calls across jobs (optional)
             - 'output_dir': Path to output directory
             - 'filename_sanitizer': Function to sanitize filenames
 
     Returns:
         Processed job object (also logged if job_logger provided)
     """
-    start_time = time.time()
-    job.start_time = start_time
+    start_time = _begin_job(job)
 
     try:
-        logger.info(f"\n{'='*60}")
-        logger.debug(f"Processing Job: {job.video_id}")
-        logger.info(f"{'='*60}")
-
         # Stage 1: Fetch
         job = fetch_transcript_and_title(
             job,
@@ -432,44 +599,221 @@ def process_video_job(
         )
 
         # Stage 2: Generate
-        job = generate_study_notes(job, components['notes_generator'])
-        job = generate_assessment(job, components.get('assessment_generator'))
-
-        # Stage 3: Write
-        job = write_markdown_files(
-            job,
-            components['output_dir'],
-            components['filename_sanitizer']
-        )
-        job = process_obsidian_links(job, components['obsidian_linker'])
+        claude_semaphore = components.get('claude_semaphore')
+        job = generate_study_notes(job, components['notes_generator'], claude_semaphore)
+
+        # The assessment only feeds its own file, so generate it while the
+        # notes are written and exported instead of ahead of them
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='assessment') as pool:
+            assessment_future = pool.submit(
+                generate_assessment,
+                job,
+                components.get('assessment_generator'),
+                claude_semaphore
+            )
 
-        # Stage 4: Export
-        job = export_pdfs(job, components.get('pdf_exporter'))
+            # Stage 3: Write (with Obsidian links applied in memory)
+            job = write_markdown_files(
+                job,
+                components['output_dir'],
+                components['filename_sanitizer'],
+                components['obsidian_linker']
+            )
 
-        # Mark as completed
-        job.end_time = time.time()
-        job.processing_duration = job.end_time - start_time
-        job.mark_completed(job.processing_duration)
+            # Stage 4: Export
+            job = export_pdfs(job, components.get('pdf_exporter'))
 
-        logger.success(f"  ✓ Job completed in {job.processing_duration:.1f}s")
-        logger.info(f"{'='*60}\n")
+            assessment_future.result()
 
-        # Log job if logger provided
-        if components.get('job_logger'):
-            components['job_logger'].log_job(job)
+        job = write_assessment_file(job, components['filename_sanitizer'])
 
-        return job
+        return _finish_job(job, components, start_time)
 
     except Exception as e:
-        job.end_time = time.time()
-        job.processing_duration = job.end_time - start_time
-        job.mark_failed(str(e))
+        return _finish_job(job, components, start_time, error=e)
 
-        logger.error(f"  ✗ Job failed: {e}")
-        logger.info(f"{'='*60}\n")
 
-        # Log failed job if logger provided
-        if components.get('job_logger'):
-            components['job_logger'].log_job(job)
+# ============================================================================
+# Batched Pipeline (Message Batches API for large runs)
+# ============================================================================
 
-        return job
+# Below this many jobs the batch turnaround (minutes to hours) isn't worth
+# the discount, so generation falls back to one call per job
+DEFAULT_MIN_BATCH_SIZE = 20
+
+
+def generate_study_notes_batch(
+    jobs: List[VideoProcessingJob],
+    notes_generator
+) -> List[VideoProcessingJob]:
+    """
+    Generate notes for many jobs in one Message Batches submission.
+
+    Resumable: Jobs that already have notes are left out of the batch.
+    Jobs whose batch request failed are left without notes so the caller
+    can fall back to generate_study_notes.
+
+    Args:
+        jobs: Jobs with transcripts fetched
+        notes_generator: StudyNotesGenerator instance
+
+    Returns:
+        Same job objects, with study_notes populated where the batch succeeded
+    """
+    pending = [job for job in jobs if job.has_transcript() and not job.has_notes()]
+    if not pending:
+        return jobs
+
+    stage_start = time.perf_counter_ns()
+    for job in pending:
+        job.set_stage(ProcessingStage.GENERATING_NOTES)
+
+    logger.info("Submitting notes batch for {} jobs...", len(pending))
+    notes = notes_generator.generate_notes_batch({
+        job.video_id: (job.transcript, job.needs_ai_title)
+        for job in pending
+    })
+    elapsed = (time.perf_counter_ns() - stage_start) / 1e9
+
+    for job in pending:
+        if not notes.get(job.video_id):
+            logger.warning("  [Job {}] Not in notes batch results, will retry individually", job.video_id)
+            job.set_stage(ProcessingStage.TRANSCRIPT_FETCHED)
+            continue
+
+        job.study_notes = notes[job.video_id]
+        _apply_ai_title(job)
+        job.set_stage(ProcessingStage.NOTES_GENERATED)
+        job.add_timing('generate_notes', elapsed)
+
+    logger.success("  ✓ Notes batch returned {}/{} results", len(notes), len(pending))
+    return jobs
+
+
+def generate_assessment_batch(
+    jobs: List[VideoProcessingJob],
+    assessment_generator
+) -> List[VideoProcessingJob]:
+    """
+    Generate assessments for many jobs in one Message Batches submission.
+
+    Resumable: Jobs that already have an assessment are left out of the batch.
+    Jobs whose batch request failed are left without an assessment so the
+    caller can fall back to generate_assessment.
+
+    Args:
+        jobs: Jobs with notes generated
+        assessment_generator: AssessmentGenerator instance
+
+    Returns:
+        Same job objects, with assessment_content populated where the batch succeeded
+    """
+    if not assessment_generator:
+        return jobs
+
+    pending = [job for job in jobs if job.has_notes() and not job.has_assessment()]
+    if not pending:
+        return jobs
+
+    stage_start = time.perf_counter_ns()
+    for job in pending:
+        job.assessment_stage = ProcessingStage.GENERATING_ASSESSMENT
+
+    logger.info("Submitting assessment batch for {} jobs...", len(pending))
+    assessments = assessment_generator.generate_assessment_batch({
+        job.video_id: {
+            'transcript': job.transcript,
+            'notes_content': job.study_notes,
+            'video_title': job.video_title,
+            'video_url': job.get_youtube_url()
+        }
+        for job in pending
+    })
+    elapsed = (time.perf_counter_ns() - stage_start) / 1e9
+
+    for job in pending:
+        if not assessments.get(job.video_id):
+            job.assessment_stage = None
+            continue
+
+        job.assessment_content = assessments[job.video_id]
+        job.assessment_stage = ProcessingStage.ASSESSMENT_GENERATED
+        job.add_timing('generate_assessment', elapsed)
+
+    logger.success("  ✓ Assessment batch returned {}/{} results", len(assessments), len(pending))
+    return jobs
+
+
+def process_video_jobs_batched(
+    jobs: List[VideoProcessingJob],
+    components: dict,
+    min_batch_size: int = DEFAULT_MIN_BATCH_SIZE
+) -> List[VideoProcessingJob]:
+    """
+    Process many jobs, sending all Claude calls through the Message Batches API.
+
+    Trades latency for cost: every transcript is fetched first, then all notes
+    go out as one batch and all assessments as a second one. Runs with fewer
+    than min_batch_size fetched jobs use per-call generation instead, and any
+    job missing from a batch's results is retried with a regular call.
+
+    Args:
+        jobs: Jobs to process
+        components: Components dict (see process_video_job)
+        min_batch_size: Minimum fetched jobs before batching is used
+
+    Returns:
+        Processed jobs, in the same order as given
+    """
+    start_times = {}
+    fetched = []
+
+    # Stage 1: Fetch (sequential - all jobs share one Tor daemon)
+    for job in jobs:
+        start_times[id(job)] = _begin_job(job)
+        try:
+            fetch_transcript_and_title(
+                job,
+                components['video_processor'],
+                worker_id=job.worker_id
+            )
+            fetched.append(job)
+        except Exception as e:
+            _finish_job(job, components, start_times[id(job)], error=e)
+
+    use_batches = len(fetched) >= min_batch_size
+
+    # Stage 2: Generate (batched, with per-call fallback)
+    if use_batches:
+        generate_study_notes_batch(fetched, components['notes_generator'])
+
+    ready = []
+    for job in fetched:
+        try:
+            if not job.has_notes():
+                job = generate_study_notes(job, components['notes_generator'])
+            ready.append(job)
+        except Exception as e:
+            _finish_job(job, components, start_times[id(job)], error=e)
+
+    if use_batches:
+        generate_assessment_batch(ready, components.get('assessment_generator'))
+
+    # Stages 3-4 per job
+    for job in ready:
+        try:
+            if not job.has_assessment():
+                job = generate_assessment(job, components.get('assessment_generator'))
+            job = write_markdown_files(
+                job,
+                components['output_dir'],
+                components['filename_sanitizer'],
+                components['obsidian_linker']
+            )
+            job = export_pdfs(job, components.get('pdf_exporter'))
+            job = write_assessment_file(job, components['filename_sanitizer'])
+            _finish_job(job, components, start_times[id(job)])
+        except Exception as e:
+            _finish_job(job, components, start_times[id(job)], error=e)
+
+    return jobs
@@ -4,15 +4,30 @@ Rotating Tor HTTP client that ensures fresh exit IPs for YouTube requests.
 Automatically rotates Tor circuit and validates exit IP hasn't been used recently
 before making YouTube API calls. Enforces 24-hour cooldown on exit IPs.
 """
+import ipaddress
+import secrets
+import threading
 import time
 import requests
-from typing import Optional, Dict, Any
-from stem import Signal
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
+from typing import Optional, Dict, Any, Tuple
+from stem import CircPurpose, CircStatus, Signal, SocketClosed
 from stem.control import Controller
 
 from .exit_node_tracker import get_tracker
 from loguru import logger
 
+# Minimum seconds Tor enforces between honoured NEWNYM signals
+NEWNYM_INTERVAL = 10.0
+
+# Independent plain-text IP echo services, raced so one slow service
+# doesn't stall exit IP discovery
+EXIT_IP_ENDPOINTS = (
+    'https://api.ipify.org',
+    'https://icanhazip.com',
+    'https://ifconfig.me/ip',
+)
+EXIT_IP_TIMEOUT = 5.0
 
 class RotatingTorClient:
     """
@@ -44,7 +59,9 @@ class RotatingTorClient:
         control_port: int = 9051,
         tor_password: Optional[str] = None,
         cooldown_hours: float = 24.0,
-        max_rotation_attempts: int = 5
+        max_rotation_attempts: int = 5,
+        exit_ip_ttl: float = 300.0,
+        isolate_circuits: bool = True
     ):
         """
         Initialize rotating Tor client.
@@ -56,6 +73,12 @@ class RotatingTorClient:
             tor_password: Tor control password (default: None)
             cooldown_hours: Hours to wait before reusing exit IP (default: 24)
             max_rotation_attempts: Max rotations to find fresh IP (default: 5)
+            exit_ip_ttl: Seconds to trust a probed exit IP before re-checking,
+                when the control port can't tell whether the circuit
+                changed (default: 300)
+            isolate_circuits: Get new circuits by switching SOCKS credentials
+                (Tor's IsolateSOCKSAuth) instead of rate-limited NEWNYM
+                (default: True)
         """
         self.tor_host = tor_host
         self.tor_port = tor_port
@@ -63,6 +86,8 @@ class RotatingTorClient:
         self.tor_password = tor_password
         self.cooldown_hours = cooldown_hours
         self.max_rotation_attempts = max_rotation_attempts
+        self.exit_ip_ttl = exit_ip_ttl
+        self.isolate_circuits = isolate_circuits
 
         # Initialize exit node tracker with 24-hour cooldown
         self.tracker = get_tracker(cooldown_hours=cooldown_hours)
@@ -74,51 +99,224 @@ class RotatingTorClient:
             'https': f'socks5h://{tor_host}:{tor_port}'
         }
 
+        # Tor gives each distinct SOCKS username/password its own circuit, so
+        # a new credential is a new circuit without waiting on NEWNYM
+        self._isolation_token = secrets.token_hex(4)
+        self._circuit_slot = 0
+
         self.current_exit_ip: Optional[str] = None
+        self._exit_ip_checked_at = 0.0
+        self._exit_ip_circuit: Optional[Tuple[str, str]] = None  # circuit it was probed on
+
+        # Control connection, opened on first rotation and kept for reuse
+        self._controller: Optional[Controller] = None
+        self._controller_lock = threading.Lock()
+        self._last_newnym = float('-inf')
+        self._rotation_failures = 0
 
     def _get_exit_ip(self) -> str:
         """
         Get current Tor exit IP.
 
+        Queries every EXIT_IP_ENDPOINTS service at once and returns the
+        first valid answer. Each call gets its own pool: slower probes can't
+        be interrupted, so they finish in the background instead of
+        occupying threads the next call needs.
+
         Returns:
             Exit IP address
         """
+        executor = ThreadPoolExecutor(
+            max_workers=len(EXIT_IP_ENDPOINTS), thread_name_prefix='exit-ip-probe'
+        )
+        futures = [
+            executor.submit(self.session.get, url, timeout=EXIT_IP_TIMEOUT)
+            for url in EXIT_IP_ENDPOINTS
+        ]
+        errors = []
         try:
-            response = self.session.get(
-                'https://api.ipify.org?format=json',
-                timeout=10
-            )
-            return response.json()['ip']
+            for future in as_completed(futures, timeout=EXIT_IP_TIMEOUT):
+                try:
+                    exit_ip = future.result().text.strip()
+                    ipaddress.ip_address(exit_ip)
+                    return exit_ip
+                except Exception as e:
+                    errors.append(e)
+        except FuturesTimeout:
+            errors.append(f"no answer within {EXIT_IP_TIMEOUT:.0f}s")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        raise RuntimeError(f"Failed to get exit IP: {errors}")
+
+    def _current_exit_ip(self) -> str:
+        """
+        Get current Tor exit IP, reusing the last probe while it is still valid.
+
+        The IP always comes from an HTTP probe (_get_exit_ip). The control
+        port is only used to tell whether our circuit changed since then:
+        while it reports the same circuit the cached IP is kept, and a
+        different circuit forces a new probe. When the circuit can't be
+        determined, the cached value is trusted for ``exit_ip_ttl``.
+
+        Returns:
+            Exit IP address
+        """
+        circuit = self._current_circuit()
+
+        if self.current_exit_ip is not None:
+            if circuit is not None:
+                if circuit == self._exit_ip_circuit:
+                    self._exit_ip_checked_at = time.monotonic()
+                    return self.current_exit_ip
+            elif time.monotonic() - self._exit_ip_checked_at < self.exit_ip_ttl:
+                return self.current_exit_ip
+
+        self.current_exit_ip = self._get_exit_ip()
+        self._exit_ip_checked_at = time.monotonic()
+        # A new credential has no circuit until the probe's own stream builds one
+        self._exit_ip_circuit = circuit or self._current_circuit()
+        return self.current_exit_ip
+
+    def _current_circuit(self) -> Optional[Tuple[str, str]]:
+        """
+        Identify this client's circuit through the control port.
+
+        Only answers when the circuit is unambiguous: SOCKS isolation is in
+        use and Tor has exactly one built circuit for our credential.
+
+        This is a hint for cache invalidation, not an exit IP lookup: the
+        exit relay's consensus (OR) address is where it accepts relay
+        connections, and a relay may send exit traffic from a different
+        address, so the IP itself is only ever taken from an HTTP probe.
+
+        Returns:
+            (circuit ID, exit relay fingerprint), or None if it can't be determined
+        """
+        username = self._socks_username
+        if username is None:
+            return None
+
+        try:
+            with self._controller_lock:
+                circuits = [
+                    circ for circ in self._get_controller().get_circuits()
+                    if circ.status == CircStatus.BUILT
+                    and circ.purpose == CircPurpose.GENERAL
+                    and circ.socks_username == username
+                    and circ.path
+                ]
+            if len(circuits) != 1:
+                return None
+            return circuits[0].id, circuits[0].path[-1][0]
+
         except Exception as e:
-            raise RuntimeError(f"Failed to get exit IP: {e}")
+            logger.debug("Circuit lookup via control port failed: {}", e)
+            return None
 
-    def _rotate_circuit(self):
-        """Rotate Tor circuit to get new exit IP."""
+    def invalidate_exit_ip(self):
+        """Forget the cached exit IP so the next request re-probes it."""
+        self.current_exit_ip = None
+        self._exit_ip_circuit = None
+
+    def _send(self, send, *args, **kwargs) -> requests.Response:
+        """
+        Call a session method, dropping the cached exit IP if the request fails.
+
+        Tor can move our credential onto a new circuit on its own (after
+        MaxCircuitDirtiness or a circuit failure), which usually shows up as
+        a failed or reset connection; the next request then re-probes
+        instead of checking cooldowns against a stale IP.
+        """
         try:
-            with Controller.from_port(
+            return send(*args, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            self.invalidate_exit_ip()
+            raise
+
+    def _get_controller(self) -> Controller:
+        """
+        Get the authenticated control connection, opening it on first use.
+
+        Must be called with ``_controller_lock`` held.
+
+        Returns:
+            Authenticated stem Controller
+        """
+        if self._controller is None or not self._controller.is_alive():
+            controller = Controller.from_port(
                 address=self.tor_host,
                 port=self.control_port
-            ) as controller:
+            )
+            try:
                 if self.tor_password:
                     controller.authenticate(password=self.tor_password)
                 else:
                     controller.authenticate()
+            except Exception:
+                controller.close()
+                raise
+            self._controller = controller
+        return self._controller
+
+    def _drop_controller(self):
+        """Close the control connection (must be called with lock held)."""
+        if self._controller is not None:
+            self._controller.close()
+            self._controller = None
 
-                # Send NEWNYM signal
-                controller.signal(Signal.NEWNYM)
+    def _rotate_circuit(self):
+        """Rotate Tor circuit to get new exit IP."""
+        # Tor ignores NEWNYM sent within 10s of the previous one, so wait out
+        # only what is left of that window instead of a fixed delay
+        remaining = NEWNYM_INTERVAL - (time.monotonic() - self._last_newnym)
+        if remaining > 0:
+            logger.info(f"  Waiting {remaining:.0f}s for Tor cooldown...")
+            time.sleep(remaining)
 
-                # Wait for Tor to be ready
-                wait_time = controller.get_newnym_wait()
-                if wait_time > 0:
-                    logger.info(f"  Waiting {wait_time:.0f}s for Tor cooldown...")
-                    time.sleep(wait_time)
-                else:
-                    # Default wait if no cooldown
-                    time.sleep(2)
+        try:
+            with self._controller_lock:
+                try:
+                    controller = self._get_controller()
+                    # Send NEWNYM signal
+                    controller.signal(Signal.NEWNYM)
+                except SocketClosed:
+                    # Tor dropped the kept-alive connection; reconnect once
+                    self._drop_controller()
+                    controller = self._get_controller()
+                    controller.signal(Signal.NEWNYM)
+                self._last_newnym = time.monotonic()
+                self._rotation_failures = 0
+                self.invalidate_exit_ip()
+
+            # Kept-alive connections would stay on the old circuit
+            self.session.close()
 
         except Exception as e:
+            with self._controller_lock:
+                self._drop_controller()
             logger.error(f"⚠️  Circuit rotation failed: {e}")
-            time.sleep(2)  # Wait anyway
+            # Back off on repeated failures, capped at the NEWNYM window
+            time.sleep(min(2 ** self._rotation_failures, NEWNYM_INTERVAL))
+            self._rotation_failures += 1
+
+    def _switch_circuit(self):
+        """Move to a new circuit, via SOCKS isolation when enabled."""
+        if not self.isolate_circuits:
+            self._rotate_circuit()
+            return
+
+        self._circuit_slot += 1
+        proxy = f'socks5h://{self._socks_username}:x@{self.tor_host}:{self.tor_port}'
+        self.session.proxies = {'http': proxy, 'https': proxy}
+        self.invalidate_exit_ip()
+
+    @property
+    def _socks_username(self) -> Optional[str]:
+        """SOCKS username isolating the current circuit (None before the first switch)."""
+        if self._circuit_slot == 0:
+            return None
+        return f'{self._isolation_token}-{self._circuit_slot}'
 
     def _ensure_fresh_exit_ip(self, force_rotation: bool = False) -> str:
         """
@@ -136,26 +334,20 @@ class RotatingTorClient:
             RuntimeError: If unable to get fresh IP after max attempts
         """
         for attempt in range(self.max_rotation_attempts):
-            # Get current exit IP
-            exit_ip = self._get_exit_ip()
+            # Get current exit IP (cached until the next rotation)
+            exit_ip = self._current_exit_ip()
 
-            # Check if IP is available (not in cooldown)
-            if not force_rotation and self.tracker.is_available(exit_ip):
+            # Availability and remaining cooldown from a single tracker read
+            available, cooldown_remaining = self.tracker.check(exit_ip)
+            if not force_rotation and available:
                 # Fresh IP found!
-                self.current_exit_ip = exit_ip
-                remaining = self.tracker.get_cooldown_remaining(exit_ip)
-
-                if remaining is None:
-                    logger.success(f"✓ Fresh exit IP: {exit_ip} (never used)")
-                else:
-                    logger.success(f"✓ Fresh exit IP: {exit_ip}")
+                logger.success(f"✓ Fresh exit IP: {exit_ip}")
 
                 # Record usage
                 self.tracker.record_use(exit_ip)
                 return exit_ip
 
             # IP is in cooldown, need to rotate
-            cooldown_remaining = self.tracker.get_cooldown_remaining(exit_ip)
             if cooldown_remaining:
                 hours_remaining = cooldown_remaining / 3600
                 logger.info(f"  Exit IP {exit_ip} in cooldown ({hours_remaining:.1f}h remaining)")
@@ -163,8 +355,8 @@ class RotatingTorClient:
                 logger.info(f"  Exit IP {exit_ip} was used recently")
 
             # Rotate to new circuit
-            logger.debug(f"  Rotating circuit (attempt {attempt + 1}/{self.max_rotation_attempts})...")
-            self._rotate_circuit()
+            logger.debug("  Rotating circuit (attempt {}/{})...", attempt + 1, self.max_rotation_attempts)
+            self._switch_circuit()
 
         # Failed to get fresh IP
         raise RuntimeError(
@@ -192,7 +384,7 @@ class RotatingTorClient:
         if ensure_fresh_ip:
             self._ensure_fresh_exit_ip()
 
-        return self.session.get(url, **kwargs)
+        return self._send(self.session.get, url, **kwargs)
 
     def post(
         self,
@@ -214,7 +406,7 @@ class RotatingTorClient:
         if ensure_fresh_ip:
             self._ensure_fresh_exit_ip()
 
-        return self.session.post(url, **kwargs)
+        return self._send(self.session.post, url, **kwargs)
 
     def request(
         self,
@@ -238,7 +430,7 @@ class RotatingTorClient:
         if ensure_fresh_ip:
             self._ensure_fresh_exit_ip()
 
-        return self.session.request(method, url, **kwargs)
+        return self._send(self.session.request, method, url, **kwargs)
 
     def get_status(self) -> Dict[str, Any]:
         """
@@ -265,3 +457,16 @@ class RotatingTorClient:
         """Force circuit rotation to get new exit IP."""
         logger.info("🔄 Forcing circuit rotation...")
         self._ensure_fresh_exit_ip(force_rotation=True)
+
+    def close(self):
+        """Close the Tor control connection and HTTP session."""
+        with self._controller_lock:
+            self._drop_controller()
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
@@ -2,10 +2,13 @@
 Study notes generation using Claude API with cross-referencing capabilities.
 """
 import os
+import re
 
 from dotenv import load_dotenv
 from loguru import logger
 
+from .llm_cache import batched_completion, cached_completion
+
 try:
     import anthropic
 except ImportError:
@@ -14,20 +17,107 @@ except ImportError:
 # Load environment variables from .env file
 load_dotenv()
 
+# Title cleanup and extraction patterns, compiled once
+_FILENAME_UNSAFE_PATTERN = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_TITLE_LINE_PATTERN = re.compile(r'^#\s+Title:\s*(.+)$', re.MULTILINE | re.IGNORECASE)
+_TITLE_LINE_STRIP_PATTERN = re.compile(r'^#\s+Title:\s*.+\n*', re.MULTILINE | re.IGNORECASE)
+_LEGACY_TITLE_PATTERN = re.compile(
+    r'^#\s+(?:VIDEO\s+)?[Vv]ideo\s+[Ss]tudy\s+[Nn]otes:\s*(.+)$', re.MULTILINE
+)
+
+# Characters of transcript sampled from the start and end for title suggestion
+TITLE_SAMPLE_HEAD = 1000
+TITLE_SAMPLE_TAIL = 500
+
+TITLE_INSTRUCTION = """
+IMPORTANT: Start your response with a descriptive title for this video on the first line as:
+# Title: <your suggested title here>
+
+The title should:
+- Be 5-10 words maximum
+- Describe the main topic/subject clearly
+- Be specific and informative
+- Use title case
+- No quotes or special characters
+
+Then continue with the study notes below.
+
+"""
+
+# Notes prompt skeleton; filled in by StudyNotesGenerator._build_prompt()
+NOTES_PROMPT_TEMPLATE = """Create comprehensive educational notes from this YouTube video transcript. Format this for learning and mind mapping.
+{title_instruction}
+
+# Video Study Notes
+
+## Core Concepts
+List the main ideas with clear, brief explanations. Focus on the fundamental principles being taught.
+
+## Key Points
+Number the most important details and insights from the video. Include specific facts, statistics, or claims made.
+
+## Examples & Applications (Only if applicable, if not, leave out)
+List concrete examples, case studies, or real-world applications mentioned in the video.
+
+## Definitions & Terminology (Only if applicable, if not, leave out)
+Extract and define key terms, jargon, or technical vocabulary used.
+
+## Connections & Relationships (Only if applicable, if not, leave out)
+How do the concepts relate to each other? What are the cause-effect relationships?{connections_instruction}
+
+## Questions for Further Study (Only if applicable, if not, leave out)
+What questions does this raise? What should I explore deeper? What wasn't fully explained?
+
+## Action Items & Practice (Only if applicable, if not, leave out)
+What concrete steps can I take to apply this knowledge? What should I practice or try?
+
+## Critical Analysis (Only if applicable, if not, leave out)
+What are the strengths and potential limitations of the ideas presented?
+{related_context}
+Transcript to analyze:
+{transcript}
+
+Please create comprehensive study notes that I can use for learning. Make them detailed but well-organized.
+I'm going to be using them to annotate and highlight sections and connect them together on Miro, an Infinite Canvas, so I need the layout of the information provided to be fairly spacious so that I can write stuff in using a stylus and also connect sections to other places on the Infinite Canvas."""
+
+
+def _title_sample(transcript: str) -> str:
+    """Take the opening and closing of a transcript, cutting the head at a sentence end."""
+    if len(transcript) <= TITLE_SAMPLE_HEAD + TITLE_SAMPLE_TAIL:
+        return transcript
+
+    cut = transcript.rfind('. ', 0, TITLE_SAMPLE_HEAD)
+    head = transcript[:cut + 1] if cut > TITLE_SAMPLE_HEAD // 2 else transcript[:TITLE_SAMPLE_HEAD]
+    return f"{head}\n...\n{transcript[-TITLE_SAMPLE_TAIL:]}"
+
 
 class StudyNotesGenerator:
     """Generates study notes using Claude API with cross-reference support."""
 
-    def __init__(self):
+    def __init__(self, llm_cache=None):
+        """
+        Args:
+            llm_cache: Optional LLMCache for reusing responses across runs
+        """
         self.client = None
+        self.llm_cache = llm_cache
         self._setup_api()
 
     def _setup_api(self):
-        """Setup Claude API client."""
+        """Setup Claude API client and record whether it is usable."""
         api_key = self.get_api_key()
         if api_key and anthropic:
             self.client = anthropic.Anthropic(api_key=api_key)
 
+        # Readiness can't change after setup, so report problems once here
+        # rather than on every is_ready() call
+        self._ready = self.client is not None
+        if not anthropic:
+            logger.error("ERROR: anthropic library not installed. Run: pip install anthropic")
+        elif not self.client:
+            logger.error("ERROR: No valid API key found")
+
     @staticmethod
     def get_api_key():
         """Get Claude API key from environment or .env file."""
@@ -44,13 +134,7 @@ class StudyNotesGenerator:
 
     def is_ready(self):
         """Check if the generator is ready to use."""
-        if not anthropic:
-            logger.error("ERROR: anthropic library not installed. Run: pip install anthropic")
-            return False
-        if not self.client:
-            logger.error("ERROR: No valid API key found")
-            return False
-        return True
+        return self._ready
 
     def suggest_title(self, transcript: str, max_length: int = 60) -> str:
         """
@@ -70,8 +154,8 @@ class StudyNotesGenerator:
             # Use faster model for quick title generation
             model = os.getenv('TITLE_GENERATION_MODEL', 'claude-3-5-haiku-20241022')
 
-            # Truncate transcript if too long (first ~2000 chars usually enough)
-            sample_transcript = transcript[:2000] if len(transcript) > 2000 else transcript
+            # Intro and wrap-up carry most of the topic signal
+            sample_transcript = _title_sample(transcript)
 
             prompt = f"""Analyze this video transcript excerpt and suggest a clear, descriptive title.
 
@@ -90,7 +174,7 @@ Respond with ONLY the title, nothing else."""
 
             message = self.client.messages.create(
                 model=model,
-                max_tokens=100,  # Short response
+                max_tokens=40,  # A title is well under 40 tokens
                 messages=[{
                     "role": "user",
                     "content": prompt
@@ -100,9 +184,8 @@ Respond with ONLY the title, nothing else."""
             title = message.content[0].text.strip()
 
             # Clean title for filename
-            import re
-            title = re.sub(r'[<>:"/\\|?*]', '_', title)
-            title = re.sub(r'\s+', ' ', title).strip()
+            title = _FILENAME_UNSAFE_PATTERN.sub('_', title)
+            title = _WHITESPACE_PATTERN.sub(' ', title).strip()
 
             # Ensure it's not too long
             if len(title) > max_length:
@@ -131,21 +214,41 @@ Respond with ONLY the title, nothing else."""
         try:
             prompt = self._build_prompt(transcript, related_notes, suggest_title)
             model = os.getenv('GENERATE_NOTES_MODEL', 'claude-sonnet-4-5-20250929')
-            message = self.client.messages.create(
-                model=model,
-                max_tokens=4000,
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
+            return cached_completion(
+                self.client, model, prompt, max_tokens=4000, cache=self.llm_cache
             )
 
-            return message.content[0].text
-
         except Exception as e:
             logger.error(f"ERROR calling Claude API: {e}")
             return None
 
+    def generate_notes_batch(self, requests):
+        """Generate notes for many transcripts in one Message Batches submission.
+
+        Args:
+            requests: Dict of request ID (e.g., video ID) -> (transcript, suggest_title)
+
+        Returns:
+            Dict of request ID -> notes text. Requests that failed in the batch
+            are omitted so callers can retry them with generate_notes().
+        """
+        if not self.is_ready():
+            return {}
+
+        prompts = {
+            request_id: self._build_prompt(transcript, suggest_title=suggest_title)
+            for request_id, (transcript, suggest_title) in requests.items()
+        }
+
+        try:
+            model = os.getenv('GENERATE_NOTES_MODEL', 'claude-sonnet-4-5-20250929')
+            return batched_completion(
+                self.client, model, prompts, max_tokens=4000, cache=self.llm_cache
+            )
+        except Exception as e:
+            logger.error(f"ERROR submitting notes batch to Claude API: {e}")
+            return {}
+
     def _build_prompt(self, transcript, related_notes=None, suggest_title=False):
         """Build the prompt for Claude API.
 
@@ -169,59 +272,14 @@ Respond with ONLY the title, nothing else."""
             connections_instruction = " Also note connections to related study notes listed below - mention which notes cover similar topics and how they might connect."
 
         # Title suggestion instruction
-        title_instruction = ""
-        if suggest_title:
-            title_instruction = """
-IMPORTANT: Start your response with a descriptive title for this video on the first line as:
-# Title: <your suggested title here>
-
-The title should:
-- Be 5-10 words maximum
-- Describe the main topic/subject clearly
-- Be specific and informative
-- Use title case
-- No quotes or special characters
-
-Then continue with the study notes below.
-
-"""
-
-        prompt = f"""Create comprehensive educational notes from this YouTube video transcript. Format this for learning and mind mapping.
-{title_instruction}
+        title_instruction = TITLE_INSTRUCTION if suggest_title else ""
 
-# Video Study Notes
-
-## Core Concepts
-List the main ideas with clear, brief explanations. Focus on the fundamental principles being taught.
-
-## Key Points
-Number the most important details and insights from the video. Include specific facts, statistics, or claims made.
-
-## Examples & Applications (Only if applicable, if not, leave out)
-List concrete examples, case studies, or real-world applications mentioned in the video.
-
-## Definitions & Terminology (Only if applicable, if not, leave out)
-Extract and define key terms, jargon, or technical vocabulary used.
-
-## Connections & Relationships (Only if applicable, if not, leave out)
-How do the concepts relate to each other? What are the cause-effect relationships?{connections_instruction}
-
-## Questions for Further Study (Only if applicable, if not, leave out)
-What questions does this raise? What should I explore deeper? What wasn't fully explained?
-
-## Action Items & Practice (Only if applicable, if not, leave out)
-What concrete steps can I take to apply this knowledge? What should I practice or try?
-
-## Critical Analysis (Only if applicable, if not, leave out)
-What are the strengths and potential limitations of the ideas presented?
-{related_context}
-Transcript to analyze:
-{transcript}
-
-Please create comprehensive study notes that I can use for learning. Make them detailed but well-organized.
-I'm going to be using them to annotate and highlight sections and connect them together on Miro, an Infinite Canvas, so I need the layout of the information provided to be fairly spacious so that I can write stuff in using a stylus and also connect sections to other places on the Infinite Canvas."""
-
-        return prompt
+        return NOTES_PROMPT_TEMPLATE.format(
+            title_instruction=title_instruction,
+            connections_instruction=connections_instruction,
+            related_context=related_context,
+            transcript=transcript,
+        )
 
     @staticmethod
     def extract_title_from_notes(study_notes):
@@ -236,18 +294,16 @@ I'm going to be using them to annotate and highlight sections and connect them t
         Returns:
             Tuple of (extracted_title, notes_without_title) or (None, study_notes)
         """
-        import re
-
         # Try to match "# Title: ..." pattern first (suggest_title format)
-        match = re.search(r'^#\s+Title:\s*(.+)$', study_notes, re.MULTILINE | re.IGNORECASE)
+        match = _TITLE_LINE_PATTERN.search(study_notes)
         if match:
             title = match.group(1).strip()
             # Remove the title line from notes
-            notes_without_title = re.sub(r'^#\s+Title:\s*.+\n*', '', study_notes, count=1, flags=re.MULTILINE | re.IGNORECASE)
+            notes_without_title = _TITLE_LINE_STRIP_PATTERN.sub('', study_notes, count=1)
             return title, notes_without_title.strip()
 
         # Try old pattern for backward compatibility
-        match = re.search(r'^#\s+(?:VIDEO\s+)?[Vv]ideo\s+[Ss]tudy\s+[Nn]otes:\s*(.+)$', study_notes, re.MULTILINE)
+        match = _LEGACY_TITLE_PATTERN.search(study_notes)
         if match:
             return match.group(1).strip(), study_notes
 
@@ -261,7 +317,7 @@ I'm going to be using them to annotate and highlight sections and connect them t
         os.makedirs(output_dir, exist_ok=True)
 
         # Try to extract a better title from the generated notes
-        extracted_title = self.extract_title_from_notes(study_notes)
+        extracted_title, study_notes = self.extract_title_from_notes(study_notes)
         if extracted_title:
             # Use the extracted title for both the filename and header
             final_title = extracted_title
@@ -279,13 +335,27 @@ I'm going to be using them to annotate and highlight sections and connect them t
         safe_title = VideoProcessor.sanitize_filename(final_title)
         filename = os.path.join(output_dir, f"{safe_title}.md")
 
-        # Handle duplicate filenames
-        counter = 1
-        original_filename = filename
-        while os.path.exists(filename):
-            name_part = os.path.splitext(original_filename)[0]
-            filename = f"{name_part}_{counter}.md"
-            counter += 1
+        # Handle duplicate filenames: one directory scan collects every taken
+        # "<title>_N.md" instead of probing each N with os.path.exists().
+        # A suffix is only added when "<title>.md" itself exists, and the
+        # first free N is used, as the probing loop did.
+        suffix_pattern = re.compile(rf'^{re.escape(safe_title)}(?:_(\d+))?\.md$')
+        base_exists = False
+        taken = set()
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                match = suffix_pattern.match(entry.name)
+                if not match:
+                    continue
+                if match.group(1) is None:
+                    base_exists = True
+                else:
+                    taken.add(match.group(1))
+        if base_exists:
+            counter = 1
+            while str(counter) in taken:
+                counter += 1
+            filename = os.path.join(output_dir, f"{safe_title}_{counter}.md")
 
         # Write the file
         with open(filename, 'w', encoding='utf-8') as f:
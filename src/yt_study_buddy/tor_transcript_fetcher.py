@@ -13,6 +13,7 @@ from contextlib import contextmanager
 from typing import Optional, List, Dict, Any
 
 import requests
+from requests.adapters import HTTPAdapter
 from loguru import logger
 from stem import Signal, SocketError
 from stem.control import Controller
@@ -25,6 +26,82 @@ from .exit_node_tracker import get_tracker
 from .daily_exit_tracker import get_daily_tracker
 from .error_classifier import simplify_error
 
+# Transcript cleanup patterns, compiled once
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_NOISE_TAG_PATTERN = re.compile(r'\[(?:Music|Applause)\]')
+
+
+# ============================================================================
+# Shared HTTP sessions (one per Tor SOCKS endpoint)
+# ============================================================================
+
+# Seconds before a shared session is recycled, so long runs don't pin a
+# circuit forever through kept-alive connections
+MAX_SESSION_AGE = 600
+
+# Keep-alive connections retained per host
+SESSION_POOL_MAXSIZE = 16
+
+_shared_sessions: Dict[str, tuple[requests.Session, float]] = {}
+_shared_sessions_lock = threading.Lock()
+
+
+def _new_session() -> requests.Session:
+    """Create a session with a keep-alive pool sized for parallel workers."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=SESSION_POOL_MAXSIZE)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get_shared_session(proxy_url: str) -> requests.Session:
+    """
+    Get the shared session for a Tor SOCKS endpoint.
+
+    All fetchers (and therefore all jobs and workers) routed through the same
+    proxy reuse one connection pool instead of re-doing SOCKS+TLS handshakes.
+    Sessions older than MAX_SESSION_AGE are recycled.
+
+    Args:
+        proxy_url: SOCKS proxy URL (e.g., 'socks5://127.0.0.1:9050')
+
+    Returns:
+        Shared requests.Session for that proxy
+    """
+    with _shared_sessions_lock:
+        entry = _shared_sessions.get(proxy_url)
+        now = time.time()
+        if entry is not None and now - entry[1] < MAX_SESSION_AGE:
+            return entry[0]
+
+        if entry is not None:
+            entry[0].close()
+        session = _new_session()
+        _shared_sessions[proxy_url] = (session, now)
+        return session
+
+
+def reset_shared_session(proxy_url: str) -> requests.Session:
+    """
+    Drop kept-alive connections for a Tor SOCKS endpoint.
+
+    Must be called after NEWNYM - pooled connections keep using the old circuit.
+
+    Args:
+        proxy_url: SOCKS proxy URL
+
+    Returns:
+        Fresh shared session for that proxy
+    """
+    with _shared_sessions_lock:
+        entry = _shared_sessions.pop(proxy_url, None)
+        if entry is not None:
+            entry[0].close()
+        session = _new_session()
+        _shared_sessions[proxy_url] = (session, time.time())
+        return session
+
 
 class SingleTorCoordinator:
     """
@@ -113,7 +190,7 @@ class SingleTorCoordinator:
         try:
             yield fetcher
         finally:
-            logger.debug(f"  {worker_label} released Tor connection (shared mode)")
+            logger.debug("  {} released Tor connection (shared mode)", worker_label)
 
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about Tor usage."""
@@ -259,7 +336,7 @@ class TorExitNodePool:
                 timeout=10
             )
             exit_ip = response.text.strip()
-            logger.debug(f"  Connection #{connection_id} exit IP: {exit_ip}")
+            logger.debug("  Connection #{} exit IP: {}", connection_id, exit_ip)
             return exit_ip
         except Exception as e:
             logger.error(f"  Warning: Could not get exit IP for connection #{connection_id}: {e}")
@@ -318,8 +395,8 @@ class TorExitNodePool:
                     continue
 
                 # Check persistent cooldown (reused within last hour)
-                if not self._tracker.is_available(exit_ip):
-                    cooldown_remaining = self._tracker.get_cooldown_remaining(exit_ip)
+                available, cooldown_remaining = self._tracker.check(exit_ip)
+                if not available:
                     minutes_remaining = int(cooldown_remaining / 60) if cooldown_remaining else 0
                     logger.warning(f"  ⚠ {worker_label}: Exit IP {exit_ip} in cooldown "
                                    f"({minutes_remaining}m remaining)")
@@ -516,7 +593,6 @@ class TorTranscriptFetcher:
             'http': f'socks5://{tor_host}:{tor_port}',
             'https': f'socks5://{tor_host}:{tor_port}'
         }
-        self.session = requests.Session()
         self.tor_host = tor_host
         self.tor_port = tor_port
         self.tor_control_port = tor_control_port
@@ -529,6 +605,11 @@ class TorTranscriptFetcher:
         # Daily exit node tracker
         self.daily_tracker = get_daily_tracker()
 
+    @property
+    def session(self) -> requests.Session:
+        """Shared keep-alive session for this fetcher's Tor endpoint."""
+        return get_shared_session(self.proxies['https'])
+
     def _record_attempt(self, video_id: str, attempt: int, success: bool, exit_ip: Optional[str] = None):
         """
         Record an attempt in the daily tracker.
@@ -582,7 +663,7 @@ class TorTranscriptFetcher:
             # Get list of IPs that failed today
             failed_ips = set(self.daily_tracker.get_failed_ips_today())
             if failed_ips:
-                logger.debug(f"Avoiding {len(failed_ips)} failed IPs from today")
+                logger.debug("Avoiding {} failed IPs from today", len(failed_ips))
 
             for attempt in range(max_retries):
                 try:
@@ -603,8 +684,7 @@ class TorTranscriptFetcher:
                             # CRITICAL: Close session to break persistent connections
                             # requests.Session() maintains connection pool that reuses same circuit
                             # Must create fresh connection to use new Tor circuit
-                            self.session.close()
-                            self.session = requests.Session()
+                            reset_shared_session(self.proxies['https'])
 
                             # Wait for new circuit to be ready
                             # get_newnym_wait() is minimum, add buffer for circuit build time
@@ -808,7 +888,10 @@ class TorTranscriptFetcher:
                         http_url=self.proxies['http'],
                         https_url=self.proxies['https']
                     )
-                    api = YouTubeTranscriptApi(proxy_config=proxy_config)
+                    api = YouTubeTranscriptApi(
+                        proxy_config=proxy_config,
+                        http_client=self.session
+                    )
                     fetched = api.fetch(video_id, languages=languages)
                     # Convert to list of snippets
                     transcript_list = list(fetched)
@@ -822,7 +905,7 @@ class TorTranscriptFetcher:
                             timeout=5
                         ).text
                         logger.error(f"✗ Fetch failed (attempt {attempt + 1}): {simplify_error(str(fetch_error))}")
-                        logger.debug(f"   Exit IP: {exit_ip}")
+                        logger.debug("   Exit IP: {}", exit_ip)
 
                         # Record failure in daily tracker
                         self._record_attempt(video_id, attempt + 1, success=False, exit_ip=exit_ip)
@@ -841,9 +924,9 @@ class TorTranscriptFetcher:
                 transcript_text = ' '.join([snippet.text for snippet in transcript_list])
 
                 # Clean up the transcript
-                transcript_text = re.sub(r'\s+', ' ', transcript_text)
-                transcript_text = transcript_text.replace('[Music]', '').replace('[Applause]', '')
-                logger.debug(f'transcript char len {len(transcript_text)}')
+                transcript_text = _WHITESPACE_PATTERN.sub(' ', transcript_text)
+                transcript_text = _NOISE_TAG_PATTERN.sub('', transcript_text)
+                logger.debug('transcript char len {}', len(transcript_text))
                 # Calculate video duration
                 duration_info = None
                 if transcript_list:
@@ -1157,7 +1240,7 @@ if __name__ == "__main__":
         try:
             # Acquire connection from pool (auto-releases on exit)
             with pool.acquire(worker_id=worker_id) as fetcher:
-                logger.debug(f"Worker {worker_id}: Processing {video_id}")
+                logger.debug("Worker {}: Processing {}", worker_id, video_id)
                 transcript = fetcher.fetch_with_fallback(video_id)
 
                 if transcript:
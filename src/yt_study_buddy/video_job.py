@@ -7,9 +7,11 @@ the processing pipeline:
   2. Generate notes & assessment
   3. Write files & export PDFs
 """
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, NamedTuple
 from enum import Enum
 
 
@@ -29,6 +31,14 @@ class ProcessingStage(Enum):
     FAILED = "failed"
 
 
+class OutputPaths(NamedTuple):
+    """Every file a job writes, planned once when its files are first written."""
+    notes_file: Path
+    assessment_file: Path
+    pdf_dir: Path
+    notes_pdf: Path
+
+
 @dataclass
 class VideoProcessingJob:
     """
@@ -74,6 +84,8 @@ class VideoProcessingJob:
     output_dir: Optional[Path] = None
     notes_filepath: Optional[Path] = None
     assessment_filepath: Optional[Path] = None
+    output_paths: Optional[OutputPaths] = field(default=None, repr=False)
+    notes_markdown: Optional[str] = field(default=None, repr=False)  # As written, kept for PDF export
 
     # ========================================================================
     # Stage 4: PDF Export
@@ -86,6 +98,9 @@ class VideoProcessingJob:
     # Metadata
     # ========================================================================
     stage: ProcessingStage = ProcessingStage.CREATED
+    # Assessment runs alongside the notes write/export stages, so it tracks
+    # its progress here instead of in stage
+    assessment_stage: Optional[ProcessingStage] = None
     success: bool = False
     error: Optional[str] = None
     start_time: Optional[float] = None
@@ -144,6 +159,18 @@ class VideoProcessingJob:
         """Record timing for a stage."""
         self.timings[stage_name] = duration
 
+    @contextmanager
+    def timed_stage(self, stage_name: str):
+        """
+        Record how long the enclosed block takes as a stage timing.
+
+        Uses the monotonic perf_counter_ns clock. Nothing is recorded if
+        the block raises.
+        """
+        start = time.perf_counter_ns()
+        yield
+        self.add_timing(stage_name, (time.perf_counter_ns() - start) / 1e9)
+
     def get_youtube_url(self) -> str:
         """Get the full YouTube URL."""
         if self.url:
@@ -200,6 +227,7 @@ class VideoProcessingJob:
             'subject': self.subject,
             'worker_id': self.worker_id,
             'stage': self.stage.value,
+            'assessment_stage': self.assessment_stage.value if self.assessment_stage else None,
             'success': self.success,
             'error': self.error,
             'duration': self.processing_duration,
@@ -9,6 +9,10 @@ import yt_dlp
 from loguru import logger
 from .error_classifier import simplify_error
 
+# Transcript cleanup patterns, compiled once
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_NOISE_TAG_PATTERN = re.compile(r'\[(?:Music|Applause)\]')
+
 
 class YtDlpFallback:
     """Fetch YouTube transcripts using yt-dlp as fallback method."""
@@ -72,8 +76,8 @@ class YtDlpFallback:
                     return None
 
                 # Clean up transcript
-                transcript_text = re.sub(r'\s+', ' ', transcript_text)
-                transcript_text = transcript_text.replace('[Music]', '').replace('[Applause]', '')
+                transcript_text = _WHITESPACE_PATTERN.sub(' ', transcript_text)
+                transcript_text = _NOISE_TAG_PATTERN.sub('', transcript_text)
 
                 # Get video duration
                 duration_seconds = info.get('duration', 0)
@@ -0,0 +1,39 @@
+"""Tests for the persistent embedding cache."""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from yt_study_buddy.embedding_cache import EmbeddingCache
+
+
+@pytest.mark.unit
+def test_vectors_persist_across_instances(tmp_path):
+    """A stored vector is returned as float32 by a fresh cache instance."""
+    cache_file = tmp_path / "emb.sqlite"
+    EmbeddingCache(cache_file).put("model-a", "Machine Learning", [0.5, 0.25, 1.0])
+
+    vector = EmbeddingCache(cache_file).get("model-a", "Machine Learning")
+
+    assert vector.dtype == np.float32
+    assert vector.tolist() == [0.5, 0.25, 1.0]
+
+
+@pytest.mark.unit
+def test_key_covers_model(tmp_path):
+    """The same text under another model is a miss."""
+    cache = EmbeddingCache(tmp_path / "emb.sqlite")
+    cache.put("model-a", "Physics", [1.0])
+
+    assert cache.get("model-b", "Physics") is None
+
+
+@pytest.mark.unit
+def test_put_many_persists_all_vectors(tmp_path):
+    """Vectors written in one batch are all readable by a fresh instance."""
+    cache_file = tmp_path / "emb.sqlite"
+    EmbeddingCache(cache_file).put_many("model-a", ["Physics", "Biology"], np.eye(2))
+
+    cache = EmbeddingCache(cache_file)
+
+    assert cache.get("model-a", "Physics").tolist() == [1.0, 0.0]
+    assert cache.get("model-a", "Biology").tolist() == [0.0, 1.0]
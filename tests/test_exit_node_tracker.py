@@ -0,0 +1,29 @@
+"""Tests for the persistent exit node cooldown tracker."""
+import pytest
+
+from yt_study_buddy.exit_node_tracker import ExitNodeTracker
+
+
+@pytest.mark.unit
+def test_check_reports_availability_and_remaining(tmp_path):
+    """check() returns availability and remaining cooldown together."""
+    tracker = ExitNodeTracker(log_path=tmp_path / "exit_nodes.json", cooldown_hours=1.0)
+
+    assert tracker.check("185.220.101.1") == (True, None)
+
+    tracker.record_use("185.220.101.1", worker_id=0)
+    available, remaining = tracker.check("185.220.101.1")
+
+    assert available is False
+    assert 3590 < remaining <= 3600
+
+
+@pytest.mark.unit
+def test_record_use_refuses_ip_in_cooldown(tmp_path):
+    """A second unforced record_use of the same IP is rejected, forced is accepted."""
+    tracker = ExitNodeTracker(log_path=tmp_path / "exit_nodes.json", cooldown_hours=1.0)
+
+    assert tracker.record_use("185.220.101.1") is True
+    assert tracker.record_use("185.220.101.1") is False
+    assert tracker.record_use("185.220.101.1", force=True) is True
+    assert tracker.get_stats()['in_cooldown'] == 1
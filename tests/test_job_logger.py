@@ -0,0 +1,90 @@
+"""Tests for the JSON array job log."""
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from yt_study_buddy import artifact_writer
+from yt_study_buddy.job_logger import JobLogger
+
+
+def make_job(video_id, success=True):
+    job = Mock()
+    job.to_json.return_value = {'video_id': video_id, 'success': success, 'title': 'Café ✓'}
+    return job
+
+
+@pytest.mark.unit
+def test_appends_match_full_rewrite_layout(tmp_path):
+    """Appended entries leave the file exactly as json.dump(indent=2) would."""
+    log_file = tmp_path / "processing_log.json"
+    job_logger = JobLogger(log_file)
+
+    job_logger.log_job(make_job("a"))
+    job_logger.log_jobs_batch([make_job("b"), make_job("c", success=False)])
+
+    jobs = job_logger.get_all_jobs()
+    assert [j['video_id'] for j in jobs] == ["a", "b", "c"]
+    assert log_file.read_text(encoding='utf-8') == json.dumps(jobs, indent=2, ensure_ascii=False)
+
+
+@pytest.mark.unit
+def test_falls_back_to_rewrite_for_malformed_file(tmp_path):
+    """A log without a closing bracket is rewritten instead of appended to."""
+    log_file = tmp_path / "processing_log.json"
+    log_file.write_text("garbage", encoding='utf-8')
+    job_logger = JobLogger(log_file)
+
+    job_logger.log_job(make_job("a"))
+
+    assert [j['video_id'] for j in job_logger.get_all_jobs()] == ["a"]
+
+
+@pytest.mark.unit
+def test_failed_append_leaves_previous_log_intact(tmp_path, monkeypatch):
+    """A crash partway through an append never leaves an unparseable log."""
+    log_file = tmp_path / "processing_log.json"
+    job_logger = JobLogger(log_file)
+    job_logger.log_job(make_job("a"))
+    before = log_file.read_text(encoding='utf-8')
+
+    def crash(fd):
+        raise OSError("disk went away")
+
+    # New content is fully written to the temp file, then the sync fails
+    monkeypatch.setattr(artifact_writer, '_datasync', crash)
+    with pytest.raises(OSError):
+        job_logger.log_job(make_job("b"))
+
+    assert log_file.read_text(encoding='utf-8') == before
+    assert [j['video_id'] for j in json.loads(before)] == ["a"]
+    assert list(tmp_path.iterdir()) == [log_file]
+
+
+@pytest.mark.unit
+def test_statistics(tmp_path):
+    """Counts, averages and error types are aggregated across the log."""
+    job_logger = JobLogger(tmp_path / "processing_log.json")
+    entries = [
+        {'success': True, 'stage': 'completed', 'processing_duration': 10.0, 'total_files': 2},
+        {'success': True, 'stage': 'completed', 'processing_duration': 20.0, 'total_files': 1},
+        {'success': False, 'stage': 'failed', 'error': 'Timeout: no response'},
+        {'success': False, 'stage': 'failed', 'error': 'Timeout: again'},
+    ]
+    jobs = []
+    for entry in entries:
+        job = Mock()
+        job.to_json.return_value = entry
+        jobs.append(job)
+    job_logger.log_jobs_batch(jobs)
+
+    stats = job_logger.get_statistics()
+
+    assert stats['total_jobs'] == 4
+    assert stats['successful'] == 2
+    assert stats['failed'] == 2
+    assert stats['success_rate'] == 0.5
+    assert stats['average_duration'] == 15.0
+    assert stats['total_files_created'] == 3
+    assert stats['error_types'] == {'Timeout': 2}
+    assert stats['stages'] == {'completed': 2, 'failed': 2}
@@ -0,0 +1,119 @@
+"""Tests for knowledge graph concept extraction."""
+import os
+
+import pytest
+
+from yt_study_buddy.knowledge_graph import KnowledgeGraph, NoteParseCache
+
+NOTES = """# Neural Networks
+
+## Core Concepts
+- Gradient descent optimization method
+### Details
+- Hidden subsection item
+
+## Definitions & Terminology
+- **Loss Function**: measures error
+
+---
+
+## Key Points
+The Transformer Architecture dominates.
+
+## Core Concepts
+- Repeated section is ignored
+"""
+
+
+@pytest.mark.unit
+def test_extracts_first_occurrence_of_each_section():
+    """Sections end at the next heading or rule; repeated headings are ignored."""
+    graph = KnowledgeGraph(base_dir="/nonexistent")
+
+    concepts = graph._extract_concepts_from_content(NOTES)
+
+    assert 'gradient descent optimization method' in concepts
+    assert 'loss function' in concepts
+    assert 'the transformer architecture' in concepts
+    assert 'hidden subsection item' not in concepts
+    assert 'repeated section is ignored' not in concepts
+
+
+@pytest.mark.unit
+def test_extracts_level_three_section_headings():
+    """'### Core Concepts' and deeper headings name the same sections as '##'."""
+    graph = KnowledgeGraph(base_dir="/nonexistent")
+    content = NOTES.replace("## Core Concepts", "### Core Concepts", 1).replace(
+        "## Key Points", "#### Key Points"
+    )
+
+    concepts = graph._extract_concepts_from_content(content)
+
+    assert 'gradient descent optimization method' in concepts
+    assert 'the transformer architecture' in concepts
+
+
+@pytest.mark.unit
+def test_index_reads_every_note(tmp_path):
+    """Notes across subject folders are indexed; untitled notes are skipped."""
+    (tmp_path / "AI").mkdir()
+    (tmp_path / "AI" / "nn.md").write_text(NOTES, encoding='utf-8')
+    (tmp_path / "AI" / "untitled.md").write_text("## Core Concepts\n- Something here\n", encoding='utf-8')
+    (tmp_path / "loose.md").write_text(NOTES.replace("# Neural Networks", "# Loose Note"), encoding='utf-8')
+
+    index = KnowledgeGraph(base_dir=str(tmp_path)).extract_concepts_from_notes()
+
+    assert set(index) == {"Neural Networks", "Loose Note"}
+    assert index["Neural Networks"]['subject'] == "AI"
+    assert index["Loose Note"]['subject'] is None
+
+
+@pytest.mark.unit
+def test_refresh_skips_unchanged_notes(tmp_path, monkeypatch):
+    """Notes whose mtime and size are unchanged are not re-parsed."""
+    note = tmp_path / "nn.md"
+    note.write_text(NOTES, encoding='utf-8')
+    graph = KnowledgeGraph(base_dir=str(tmp_path))
+    graph.extract_concepts_from_notes()
+
+    def fail(self, content):
+        raise AssertionError("unchanged note was re-parsed")
+
+    monkeypatch.setattr(KnowledgeGraph, '_extract_concepts_from_content', fail)
+    replacement = KnowledgeGraph(base_dir=str(tmp_path), parse_cache=graph.parse_cache)
+    assert set(replacement.refresh_cache()) == {"Neural Networks"}
+
+    monkeypatch.undo()
+    note.write_text(NOTES.replace("# Neural Networks", "# Deep Nets"), encoding='utf-8')
+    assert set(graph.refresh_cache()) == {"Deep Nets"}
+
+
+@pytest.mark.unit
+def test_refresh_skips_rewritten_but_identical_notes(tmp_path, monkeypatch):
+    """A note rewritten with the same bytes is not re-parsed."""
+    note = tmp_path / "nn.md"
+    note.write_text(NOTES, encoding='utf-8')
+    graph = KnowledgeGraph(base_dir=str(tmp_path))
+    graph.extract_concepts_from_notes()
+
+    stat = note.stat()
+    os.utime(note, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def fail(self, content):
+        raise AssertionError("identical note was re-parsed")
+
+    monkeypatch.setattr(KnowledgeGraph, '_extract_concepts_from_content', fail)
+    assert set(graph.refresh_cache()) == {"Neural Networks"}
+
+
+@pytest.mark.unit
+def test_parse_cache_is_per_graph_and_bounded(tmp_path):
+    """Graphs don't share parsed notes unless handed the cache, which evicts LRU."""
+    for i in range(3):
+        (tmp_path / f"n{i}.md").write_text(NOTES.replace("Neural Networks", f"Note {i}"), encoding='utf-8')
+
+    graph = KnowledgeGraph(base_dir=str(tmp_path), parse_cache=NoteParseCache(max_size=2))
+    assert len(graph.extract_concepts_from_notes()) == 3
+
+    assert len(graph.parse_cache) == 2
+    assert len(KnowledgeGraph(base_dir=str(tmp_path)).parse_cache) == 0
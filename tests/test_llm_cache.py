@@ -0,0 +1,84 @@
+"""Tests for the persistent LLM response cache."""
+from unittest.mock import Mock
+
+import pytest
+
+from yt_study_buddy.llm_cache import LLMCache, batched_completion, cached_completion
+
+
+def make_client(text="# Notes"):
+    """Mock Anthropic client returning a fixed response."""
+    client = Mock()
+    response = Mock()
+    response.content = [Mock(text=text)]
+    response.usage = Mock(input_tokens=100, output_tokens=20)
+    client.messages.create.return_value = response
+    return client
+
+
+@pytest.mark.unit
+def test_second_call_is_served_from_cache(tmp_path):
+    """Identical prompts only hit the API once, even across cache instances."""
+    client = make_client()
+    cache_file = tmp_path / "llm.sqlite"
+
+    first = cached_completion(client, "model-a", "prompt", 100, cache=LLMCache(cache_file))
+    second = cached_completion(client, "model-a", "prompt", 100, cache=LLMCache(cache_file))
+
+    assert first == second == "# Notes"
+    assert client.messages.create.call_count == 1
+
+
+@pytest.mark.unit
+def test_key_covers_model_and_prompt(tmp_path):
+    """Changing the model or prompt is a cache miss."""
+    client = make_client()
+    cache = LLMCache(tmp_path / "llm.sqlite")
+
+    cached_completion(client, "model-a", "prompt", 100, cache=cache)
+    cached_completion(client, "model-b", "prompt", 100, cache=cache)
+    cached_completion(client, "model-a", "other prompt", 100, cache=cache)
+
+    assert client.messages.create.call_count == 3
+    assert cache.get_stats()['entries'] == 3
+    assert cache.get_stats()['cached_output_tokens'] == 60
+
+
+@pytest.mark.unit
+def test_no_cache_always_calls_api():
+    """Without a cache every call goes to the API."""
+    client = make_client()
+
+    cached_completion(client, "model-a", "prompt", 100)
+    cached_completion(client, "model-a", "prompt", 100)
+
+    assert client.messages.create.call_count == 2
+
+
+def make_batch_client(texts):
+    """Mock Anthropic client whose message batch ends immediately."""
+    client = Mock()
+    client.messages.batches.create.return_value = Mock(id="batch_1", processing_status="ended")
+    client.messages.batches.results.side_effect = lambda batch_id: [
+        Mock(custom_id=custom_id,
+             result=Mock(type="succeeded", message=Mock(content=[Mock(text=text)])))
+        for custom_id, text in texts.items()
+    ]
+    return client
+
+
+@pytest.mark.unit
+def test_batched_completion_only_submits_misses(tmp_path):
+    """Cached prompts are answered locally; the rest go out as one batch."""
+    cache = LLMCache(tmp_path / "llm.sqlite")
+    cached_completion(make_client("cached"), "model-a", "prompt a", 100, cache=cache)
+    client = make_batch_client({"b": "fresh"})
+
+    results = batched_completion(
+        client, "model-a", {"a": "prompt a", "b": "prompt b"}, 100, cache=cache
+    )
+
+    assert results == {"a": "cached", "b": "fresh"}
+    [request] = client.messages.batches.create.call_args.kwargs['requests']
+    assert request['custom_id'] == "b"
+    assert cache.get(cache.make_key("model-a", "prompt b", 100)) == "fresh"
@@ -0,0 +1,60 @@
+"""Tests for Obsidian link pre-filtering."""
+from unittest.mock import patch
+
+import pytest
+from fuzzywuzzy import fuzz
+
+from yt_study_buddy.obsidian_linker import ObsidianLinker
+
+
+def make_linker(*titles):
+    linker = ObsidianLinker(base_dir="/nonexistent")
+    linker.note_titles = {title: {'subject': None} for title in titles}
+    return linker
+
+
+@pytest.mark.unit
+def test_content_without_titles_skips_matching():
+    """With no notes to link to, content never reaches phrase extraction."""
+    linker = make_linker()
+    content = "The cat sat on the mat. Dogs chased it around."
+
+    with patch.object(linker, 'find_potential_links') as find_links:
+        assert linker.apply_links(content, None) == content
+        find_links.assert_not_called()
+
+
+@pytest.mark.unit
+def test_matching_content_is_still_linked():
+    """The pre-filter lets through notes that mention a title."""
+    linker = make_linker("Neural Networks Basics")
+
+    linked = linker.apply_links("This is about Neural Networks Basics in detail.", None)
+
+    assert "[[Neural Networks Basics]]" in linked
+
+
+@pytest.mark.unit
+def test_plural_phrase_is_linked():
+    """A phrase sharing no exact word with the title still links if fuzzy-close."""
+    linker = make_linker("Transformers")
+
+    linked = linker.apply_links("Attention is what makes a Transformer work so well.", None)
+
+    assert "[[Transformers]]" in linked
+
+
+@pytest.mark.unit
+def test_length_filter_never_rejects_a_fuzzy_match():
+    """could_match_title only skips phrases the fuzzy scorer would reject too."""
+    titles = ["Transformers", "Neural Networks Basics", "Gradient Descent", "CNN"]
+    linker = make_linker(*titles)
+    phrases = ["Transformer", "Neural Network Basics", "Gradient Descents",
+               "Descent Gradient", "Cat", "Stochastic Gradient Descent Optimization"]
+
+    for phrase in phrases:
+        best = max(fuzz.token_sort_ratio(phrase, title) for title in titles)
+        if best >= linker.min_similarity:
+            assert linker.could_match_title(phrase), phrase
+
+    assert not linker.could_match_title("Stochastic Gradient Descent Optimization")
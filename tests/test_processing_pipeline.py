@@ -0,0 +1,203 @@
+"""Tests for the stateless processing pipeline."""
+import time
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from yt_study_buddy.artifact_writer import write_atomic
+from yt_study_buddy.processing_pipeline import (
+    process_video_job,
+    process_video_jobs_batched,
+)
+from yt_study_buddy.video_job import create_job_from_url, ProcessingStage
+
+
+def make_components(output_dir, notes="## Core Concepts\nSome notes."):
+    """Build a components dict with mocked network/AI dependencies."""
+    video_processor = Mock()
+    video_processor.get_transcript.side_effect = lambda video_id: {
+        'transcript': f"Transcript for {video_id}",
+        'duration': '~1 minutes',
+        'length': 20,
+        'method': 'tor'
+    }
+    video_processor.get_video_title.side_effect = lambda video_id, worker_id=None: f"Title {video_id}"
+
+    notes_generator = Mock()
+    notes_generator.generate_notes.return_value = notes
+
+    assessment_generator = Mock()
+    assessment_generator.generate_assessment.return_value = "# Assessment"
+
+    obsidian_linker = Mock()
+    obsidian_linker.process_content.side_effect = lambda content, file_path=None: content
+
+    return {
+        'video_processor': video_processor,
+        'notes_generator': notes_generator,
+        'assessment_generator': assessment_generator,
+        'obsidian_linker': obsidian_linker,
+        'pdf_exporter': None,
+        'job_logger': Mock(),
+        'output_dir': output_dir,
+        'filename_sanitizer': lambda name: name.replace(' ', '_')
+    }
+
+
+def wait_for(condition, timeout=5.0):
+    """Poll condition() until it is true or timeout seconds pass."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.mark.unit
+def test_process_video_job_writes_files(tmp_path):
+    """A single job runs through every stage and writes notes + assessment."""
+    components = make_components(tmp_path)
+    job = create_job_from_url("https://youtu.be/abc123", "abc123")
+
+    job = process_video_job(job, components)
+
+    assert job.success is True
+    assert job.stage == ProcessingStage.COMPLETED
+    assert job.notes_filepath == tmp_path / "Title_abc123.md"
+    assert job.notes_filepath.read_text(encoding='utf-8').startswith("# Title abc123")
+    assert job.assessment_filepath.read_text(encoding='utf-8') == "# Assessment"
+    assert {'fetch_transcript', 'generate_notes', 'write_files'} <= set(job.timings)
+    components['job_logger'].log_job.assert_called_once_with(job)
+
+
+@pytest.mark.unit
+def test_process_video_job_links_before_writing(tmp_path):
+    """Obsidian links are applied in memory and the notes file is written once."""
+    components = make_components(tmp_path)
+    components['obsidian_linker'].process_content.side_effect = (
+        lambda content, file_path=None: content.replace("Some notes", "Some [[Linked]] notes")
+    )
+    job = create_job_from_url("https://youtu.be/abc123", "abc123")
+
+    job = process_video_job(job, components)
+
+    assert "Some [[Linked]] notes" in job.notes_filepath.read_text(encoding='utf-8')
+    assert job.study_notes == "## Core Concepts\nSome notes."
+    components['obsidian_linker'].process_file.assert_not_called()
+
+
+@pytest.mark.unit
+def test_process_video_job_logs_written_assessment(tmp_path):
+    """The assessment is on disk by the time the job is logged."""
+    components = make_components(tmp_path)
+    job = create_job_from_url("https://youtu.be/abc123", "abc123")
+
+    job = process_video_job(job, components)
+
+    assert job.success is True
+    assert job.assessment_filepath.read_text(encoding='utf-8') == "# Assessment"
+    assert job.to_json()['assessment_file_exists'] is True
+
+
+@pytest.mark.unit
+def test_process_video_job_records_failure(tmp_path):
+    """A failing fetch marks the job failed and still logs it."""
+    components = make_components(tmp_path)
+    components['video_processor'].get_transcript.side_effect = RuntimeError("blocked")
+    job = create_job_from_url("https://youtu.be/abc123", "abc123")
+
+    job = process_video_job(job, components)
+
+    assert job.success is False
+    assert "blocked" in job.error
+    components['job_logger'].log_job.assert_called_once_with(job)
+
+
+@pytest.mark.unit
+def test_process_video_job_overlaps_assessment_with_write(tmp_path):
+    """The assessment is generated while notes are written, and written after."""
+    components = make_components(tmp_path)
+    notes_file = tmp_path / "Title_abc123.md"
+
+    def slow_assessment(*args):
+        # Only returns once the notes stage has written its file
+        assert wait_for(notes_file.exists)
+        return "# Late assessment"
+
+    components['assessment_generator'].generate_assessment.side_effect = slow_assessment
+    job = create_job_from_url("https://youtu.be/abc123", "abc123")
+
+    job = process_video_job(job, components)
+
+    assert job.success is True
+    assert job.stage == ProcessingStage.COMPLETED
+    assert job.assessment_stage == ProcessingStage.ASSESSMENT_GENERATED
+    assert job.assessment_filepath.read_text(encoding='utf-8') == "# Late assessment"
+
+
+@pytest.mark.unit
+def test_process_video_job_bounds_claude_calls(tmp_path):
+    """Notes and assessment calls both go through the shared Claude semaphore."""
+    components = make_components(tmp_path)
+    components['claude_semaphore'] = MagicMock()
+    job = create_job_from_url("https://youtu.be/abc123", "abc123")
+
+    job = process_video_job(job, components)
+
+    assert job.success is True
+    assert components['claude_semaphore'].__enter__.call_count == 2
+    assert components['claude_semaphore'].__exit__.call_count == 2
+
+
+@pytest.mark.unit
+def test_process_video_jobs_batched_falls_back_for_missing_results(tmp_path):
+    """Batch results are used when present; missing ones use a regular call."""
+    components = make_components(tmp_path)
+    components['notes_generator'].generate_notes_batch.return_value = {
+        'vid0': "## Batched notes"
+    }
+    components['assessment_generator'].generate_assessment_batch.return_value = {}
+    jobs = [create_job_from_url(f"https://youtu.be/vid{i}", f"vid{i}") for i in range(2)]
+
+    results = process_video_jobs_batched(jobs, components, min_batch_size=2)
+
+    assert all(j.success for j in results)
+    assert results[0].study_notes == "## Batched notes"
+    components['notes_generator'].generate_notes.assert_called_once()
+    assert components['assessment_generator'].generate_assessment.call_count == 2
+
+
+@pytest.mark.unit
+def test_pdf_export_renders_from_written_markdown(tmp_path):
+    """PDF export uses the in-memory markdown instead of re-reading the notes file."""
+    components = make_components(tmp_path)
+    pdf_exporter = Mock()
+    pdf_exporter.render_html.return_value = "<html></html>"
+    components['pdf_exporter'] = pdf_exporter
+    job = create_job_from_url("https://youtu.be/abc123", "abc123")
+
+    job = process_video_job(job, components)
+
+    markdown, title = pdf_exporter.render_html.call_args.args
+    assert markdown.startswith("# Title abc123")
+    pdf_exporter.html_to_pdf.assert_called_once()
+    pdf_exporter.markdown_to_pdf.assert_not_called()
+    assert job.notes_markdown is None
+
+
+@pytest.mark.unit
+def test_write_atomic_leaves_no_partial_file(tmp_path):
+    """A failed write keeps the previous file intact and removes the temp file."""
+    target = tmp_path / "Notes.md"
+    target.write_text("old", encoding='utf-8')
+
+    def chunks():
+        yield "new start"
+        raise RuntimeError("disk full")
+
+    with pytest.raises(RuntimeError):
+        write_atomic(target, chunks())
+
+    assert target.read_text(encoding='utf-8') == "old"
+    assert list(tmp_path.iterdir()) == [target]
@@ -0,0 +1,73 @@
+"""Tests for the rotating Tor client's exit IP caching."""
+import threading
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from yt_study_buddy import rotating_tor_client
+from yt_study_buddy.rotating_tor_client import RotatingTorClient
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(rotating_tor_client, 'get_tracker', lambda cooldown_hours: Mock())
+    client = RotatingTorClient()
+    client.session = Mock()
+    return client
+
+
+@pytest.mark.unit
+def test_failed_request_invalidates_cached_exit_ip(client):
+    """A connection failure may mean a new circuit, so the cached IP is dropped."""
+    client.current_exit_ip = "185.220.101.1"
+    client.session.get.side_effect = requests.exceptions.ConnectionError("reset")
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        client.get("https://example.com", ensure_fresh_ip=False)
+
+    assert client.current_exit_ip is None
+
+
+@pytest.mark.unit
+def test_successful_request_keeps_cached_exit_ip(client):
+    """Ordinary responses (including HTTP errors) leave the cache alone."""
+    client.current_exit_ip = "185.220.101.1"
+    client.session.get.return_value = Mock(status_code=429)
+
+    client.get("https://example.com", ensure_fresh_ip=False)
+
+    assert client.current_exit_ip == "185.220.101.1"
+
+
+@pytest.mark.unit
+def test_exit_ip_reprobed_when_circuit_changes(client, monkeypatch):
+    """The control port only says whether the circuit changed; IPs come from probes."""
+    circuits = iter([None, ("7", "AAAA"), ("7", "AAAA"), ("9", "BBBB"), ("9", "BBBB")])
+    monkeypatch.setattr(client, '_current_circuit', lambda: next(circuits))
+    probes = iter(["185.220.101.1", "185.220.101.2"])
+    monkeypatch.setattr(client, '_get_exit_ip', lambda: next(probes))
+
+    assert client._current_exit_ip() == "185.220.101.1"  # probe, then circuit 7 seen
+    assert client._current_exit_ip() == "185.220.101.1"  # same circuit, no probe
+    assert client._current_exit_ip() == "185.220.101.2"  # circuit 9, re-probed
+
+
+@pytest.mark.unit
+def test_slow_probes_do_not_delay_next_lookup(client, monkeypatch):
+    """Probes still running from one lookup don't block the next one."""
+    monkeypatch.setattr(rotating_tor_client, 'EXIT_IP_TIMEOUT', 0.5)
+    release = threading.Event()
+
+    def get(url, timeout):
+        if url == rotating_tor_client.EXIT_IP_ENDPOINTS[-1]:
+            return Mock(text="185.220.101.1\n")
+        release.wait()
+        return Mock(text="185.220.101.2\n")
+
+    client.session.get.side_effect = get
+    try:
+        assert client._get_exit_ip() == "185.220.101.1"
+        assert client._get_exit_ip() == "185.220.101.1"
+    finally:
+        release.set()
@@ -52,7 +52,6 @@ class TestSingleFetchWithAutoCategorization:
         with patch('yt_study_buddy.cli.VideoProcessor') as MockVideoProcessor, \
              patch('yt_study_buddy.cli.StudyNotesGenerator') as MockNotesGen, \
              patch('yt_study_buddy.cli.AutoCategorizer') as MockAutoCat, \
-             patch('yt_study_buddy.cli.ParallelVideoProcessor') as MockParallel, \
              patch('yt_study_buddy.cli.create_default_logger'):
 
             # Setup mock video processor
@@ -81,7 +80,8 @@ class TestSingleFetchWithAutoCategorization:
                 subject=None,  # No subject = auto-categorize
                 generate_assessments=False,
                 export_pdf=False,
-                parallel=False
+                parallel=False,
+                use_llm_cache=False
             )
 
             # Process a single URL
@@ -120,7 +120,6 @@ class TestSingleFetchWithAutoCategorization:
 
         with patch('yt_study_buddy.cli.VideoProcessor') as MockVideoProcessor, \
              patch('yt_study_buddy.cli.StudyNotesGenerator') as MockNotesGen, \
-             patch('yt_study_buddy.cli.ParallelVideoProcessor') as MockParallel, \
              patch('yt_study_buddy.cli.create_default_logger'):
 
             # Setup mocks
@@ -143,7 +142,8 @@ class TestSingleFetchWithAutoCategorization:
                 subject="Programming",
                 generate_assessments=False,
                 export_pdf=False,
-                parallel=False
+                parallel=False,
+                use_llm_cache=False
             )
 
             # Process URL
@@ -172,7 +172,6 @@ class TestSingleFetchWithAutoCategorization:
         with patch('yt_study_buddy.cli.VideoProcessor') as MockVideoProcessor, \
              patch('yt_study_buddy.cli.StudyNotesGenerator') as MockNotesGen, \
              patch('yt_study_buddy.cli.AutoCategorizer') as MockAutoCat, \
-             patch('yt_study_buddy.cli.ParallelVideoProcessor') as MockParallel, \
              patch('yt_study_buddy.cli.create_default_logger'):
 
             mock_processor = Mock()
@@ -198,7 +197,8 @@ class TestSingleFetchWithAutoCategorization:
                 subject=None,
                 generate_assessments=False,
                 export_pdf=False,
-                parallel=False
+                parallel=False,
+                use_llm_cache=False
             )
 
             # Process URL - should handle categorization failure gracefully
@@ -0,0 +1,30 @@
+"""Tests for writing study notes markdown files."""
+import pytest
+
+from yt_study_buddy.study_notes_generator import StudyNotesGenerator
+
+
+def write_notes(output_dir):
+    generator = StudyNotesGenerator()
+    return generator.create_markdown_file(
+        "Foo", "https://youtu.be/abc123", "Some notes.", output_dir=str(output_dir)
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("existing", [[], ["Foo_1.md"], ["Foo_2023.md"]])
+def test_base_filename_used_when_free(tmp_path, existing):
+    """Suffixed files alone (including unrelated 'Foo_2023') don't force a suffix."""
+    for name in existing:
+        (tmp_path / name).write_text("other", encoding='utf-8')
+
+    assert write_notes(tmp_path) == str(tmp_path / "Foo.md")
+
+
+@pytest.mark.unit
+def test_duplicate_filename_takes_first_free_suffix(tmp_path):
+    """With Foo.md taken, the first unused Foo_N.md is chosen."""
+    for name in ["Foo.md", "Foo_1.md", "Foo_3.md"]:
+        (tmp_path / name).write_text("other", encoding='utf-8')
+
+    assert write_notes(tmp_path) == str(tmp_path / "Foo_2.md")